@@ -26,5 +26,9 @@ class Config:
     MFA_CODE_LENGTH = int(os.getenv('MFA_CODE_LENGTH', 6))
     MFA_CODE_EXPIRY_MINUTES = int(os.getenv('MFA_CODE_EXPIRY_MINUTES', 5))
     
+    # Report caching (seconds a generated report stays valid)
+    REPORT_CACHE_TTL = int(os.getenv('REPORT_CACHE_TTL', 60))
+    REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', 128))
+    
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     TESTING = os.getenv('TESTING', 'False').lower() == 'true'
\ No newline at end of file
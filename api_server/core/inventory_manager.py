@@ -1,5 +1,6 @@
 from models.product import Product
 from models.stock_batch import StockBatch
+from datetime import date, timedelta
 
 class InventoryError(Exception):
     """Custom exception for inventory issues."""
@@ -137,7 +138,6 @@ class InventoryManager:
         Returns:
             list: List of StockBatch objects
         """
-        from datetime import date, timedelta
         cutoff_date = date.today() + timedelta(days=days_ahead)
         
         batches = StockBatch.objects(
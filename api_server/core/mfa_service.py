@@ -11,6 +11,22 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Parsed once at import; each code email only substitutes the values
+_MFA_BODY = string.Template("""
+Hello $username,
+
+Your Multi-Factor Authentication (MFA) code is:
+
+$code
+
+This code will expire in $expiry_minutes minutes.
+
+If you did not request this code, please ignore this email and contact your system administrator.
+
+Best regards,
+StockaDoodle Security Team
+""")
+
 
 class MFAService:
     """
@@ -68,20 +84,11 @@ class MFAService:
         
         # Create email message
         subject = "StockaDoodle - Your MFA Code"
-        body = f"""
-Hello {username},
-
-Your Multi-Factor Authentication (MFA) code is:
-
-{code}
-
-This code will expire in {MFAService.MFA_CODE_EXPIRY_MINUTES} minutes.
-
-If you did not request this code, please ignore this email and contact your system administrator.
-
-Best regards,
-StockaDoodle Security Team
-"""
+        body = _MFA_BODY.substitute(
+            username=username,
+            code=code,
+            expiry_minutes=MFAService.MFA_CODE_EXPIRY_MINUTES
+        )
         
         # Send email
         if MFAService.SMTP_USERNAME and MFAService.SMTP_PASSWORD:
@@ -3,12 +3,134 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, date, timedelta
 import os
+from itertools import islice
+from string import Template
 from dotenv import load_dotenv
 from core.inventory_manager import InventoryManager
 from models.user import User
 
 load_dotenv()
 
+# Email bodies are parsed once at import; each send only substitutes values
+_ALERT_FOOTER = """--
+StockaDoodle Alert System
+"""
+
+_LOW_STOCK_BODY = Template("""
+Low Stock Alert - $timestamp
+
+The following products are running low on stock:
+
+$products
+Please restock these items as soon as possible to avoid stockouts.
+
+$footer""")
+
+_EXPIRATION_BODY = Template("""
+Expiration Alert - $timestamp
+
+The following products have batches expiring within $days_ahead days:
+
+$products
+Please prioritize selling or disposing of these items to minimize losses.
+
+$footer""")
+
+_DAILY_SUMMARY_BODY = Template("""
+Daily Inventory Summary
+$today
+
+$sections
+
+Please review the full reports in the StockaDoodle system.
+
+$footer""")
+
+_LOW_STOCK_ROW = """• {name}
+  Current Stock: {stock}
+  Minimum Level: {minimum}
+  Shortage: {shortage}
+
+"""
+
+_EXPIRING_BATCH_ROW = "  - Batch #{id}: {quantity} units, expires {expires} ({days} days)\n"
+
+
+def _low_stock_row(product):
+    # stock_level runs a query, so read it once per product
+    stock = product.stock_level
+    return _LOW_STOCK_ROW.format(
+        name=product.name,
+        stock=stock,
+        minimum=product.min_stock_level,
+        shortage=product.min_stock_level - stock
+    )
+
+
+def _batch_product_names(batches):
+    """Map product_id -> product name for every product in the batches, in one query"""
+    from models.product import Product
+    product_ids = list({batch.product_id for batch in batches})
+    return {
+        product.id: product.name
+        for product in Product.objects(id__in=product_ids).only('id', 'name')
+    }
+
+
+def _days_until(expiration_date, today):
+    if isinstance(expiration_date, datetime):
+        expiration_date = expiration_date.date()
+    return (expiration_date - today).days
+
+
+# Daily summary blocks; each shows at most _DAILY_SUMMARY_TOP rows
+_DAILY_SUMMARY_TOP = 5
+_DAILY_LOW_STOCK_HEADER = "🚨 LOW STOCK ALERTS: {count} products\n\n"
+_DAILY_LOW_STOCK_ROW = "• {name}: {stock}/{minimum}\n"
+_DAILY_LOW_STOCK_MORE = "  ... and {count} more\n"
+_DAILY_EXPIRING_HEADER = "⏰ EXPIRATION ALERTS: {count} products with expiring batches\n\n"
+_DAILY_EXPIRING_ROW = "• {name}: Batch #{id} expires in {days} days\n"
+_DAILY_EXPIRING_MORE = "  ... and {count} more batches\n"
+
+
+def _daily_low_stock_section(low_stock):
+    parts = [_DAILY_LOW_STOCK_HEADER.format(count=len(low_stock))]
+    parts.extend(
+        _DAILY_LOW_STOCK_ROW.format(
+            name=product.name,
+            stock=product.stock_level,
+            minimum=product.min_stock_level
+        )
+        for product in islice(low_stock, _DAILY_SUMMARY_TOP)
+    )
+    if len(low_stock) > _DAILY_SUMMARY_TOP:
+        parts.append(_DAILY_LOW_STOCK_MORE.format(count=len(low_stock) - _DAILY_SUMMARY_TOP))
+    parts.append("\n")
+    return "".join(parts)
+
+
+def _daily_expiring_section(expiring, today):
+    product_names = _batch_product_names(expiring)
+    products_expiring = {
+        product_names[batch.product_id]
+        for batch in expiring
+        if batch.product_id in product_names
+    }
+
+    parts = [_DAILY_EXPIRING_HEADER.format(count=len(products_expiring))]
+    parts.extend(
+        _DAILY_EXPIRING_ROW.format(
+            name=product_names[batch.product_id],
+            id=batch.id,
+            days=_days_until(batch.expiration_date, today)
+        )
+        for batch in islice(expiring, _DAILY_SUMMARY_TOP)
+        if batch.product_id in product_names
+    )
+    if len(expiring) > _DAILY_SUMMARY_TOP:
+        parts.append(_DAILY_EXPIRING_MORE.format(count=len(expiring) - _DAILY_SUMMARY_TOP))
+    return "".join(parts)
+
 
 class NotificationService:
     """
@@ -80,7 +202,7 @@ class NotificationService:
             return {'status': 'no_alerts', 'count': 0}
         
         # Get all managers
-        managers = User.objects(role__in=['admin', 'manager'])
+        managers = User.objects(role__in=['admin', 'manager']).only('email')
         
         if not managers:
             return {'status': 'no_recipients', 'count': 0}
@@ -88,24 +210,13 @@ class NotificationService:
         # Build alert message
         subject = f"🚨 Low Stock Alert - {len(low_stock_products)} Products Need Attention"
         
-        body = f"""
-Low Stock Alert - {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-The following products are running low on stock:
-
-"""
-        for product in low_stock_products:
-            body += f"• {product.name}\n"
-            body += f"  Current Stock: {product.stock_level}\n"
-            body += f"  Minimum Level: {product.min_stock_level}\n"
-            body += f"  Shortage: {product.min_stock_level - product.stock_level}\n\n"
+        products = "".join(_low_stock_row(product) for product in low_stock_products)
         
-        body += """
-Please restock these items as soon as possible to avoid stockouts.
-
---
-StockaDoodle Alert System
-"""
+        body = _LOW_STOCK_BODY.substitute(
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            products=products,
+            footer=_ALERT_FOOTER
+        )
         
         # Send to all managers
         sent_count = 0
@@ -139,46 +250,44 @@ StockaDoodle Alert System
             return {'status': 'no_alerts', 'count': 0}
         
         # Get all managers
-        managers = User.objects(role__in=['admin', 'manager'])
+        managers = User.objects(role__in=['admin', 'manager']).only('email')
         
         if not managers:
             return {'status': 'no_recipients', 'count': 0}
         
         # Group batches by product
-        from models.product import Product
+        product_names = _batch_product_names(expiring_batches)
         products_expiring = {}
         for batch in expiring_batches:
-            product = Product.objects(id=batch.product.id).first()
-            if product:
-                if product.name not in products_expiring:
-                    products_expiring[product.name] = []
-                products_expiring[product.name].append(batch)
+            product_name = product_names.get(batch.product_id)
+            if product_name:
+                products_expiring.setdefault(product_name, []).append(batch)
         
         # Build alert message
         subject = f"⏰ Expiration Alert - {len(products_expiring)} Products Expiring Soon"
         
-        body = f"""
-Expiration Alert - {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-The following products have batches expiring within {days_ahead} days:
-
-"""
-        for product_name, batches in products_expiring.items():
-            body += f"• {product_name}\n"
-            for batch in batches:
-                exp_date = batch.expiration_date
-                if isinstance(exp_date, datetime):
-                    exp_date = exp_date.date()
-                days_until = (exp_date - date.today()).days
-                body += f"  - Batch #{batch.id}: {batch.quantity} units, expires {batch.expiration_date} ({days_until} days)\n"
-            body += "\n"
+        today = date.today()
+        products = "".join(
+            f"• {product_name}\n"
+            + "".join(
+                _EXPIRING_BATCH_ROW.format(
+                    id=batch.id,
+                    quantity=batch.quantity,
+                    expires=batch.expiration_date,
+                    days=_days_until(batch.expiration_date, today)
+                )
+                for batch in batches
+            )
+            + "\n"
+            for product_name, batches in products_expiring.items()
+        )
         
-        body += """
-Please prioritize selling or disposing of these items to minimize losses.
-
---
-StockaDoodle Alert System
-"""
+        body = _EXPIRATION_BODY.substitute(
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            days_ahead=days_ahead,
+            products=products,
+            footer=_ALERT_FOOTER
+        )
         
         # Send to all managers
         sent_count = 0
@@ -209,53 +318,24 @@ StockaDoodle Alert System
         if not low_stock and not expiring:
             return {'status': 'no_alerts', 'message': 'No alerts to send'}
         
-        managers = User.objects(role__in=['admin', 'manager'])
+        managers = User.objects(role__in=['admin', 'manager']).only('email')
         
         if not managers:
             return {'status': 'no_recipients'}
         
         subject = f"📊 Daily Inventory Summary - {date.today().strftime('%Y-%m-%d')}"
         
-        body = f"""
-Daily Inventory Summary
-{date.today().strftime('%A, %B %d, %Y')}
-
-"""
-        if low_stock:
-            body += f"🚨 LOW STOCK ALERTS: {len(low_stock)} products\n\n"
-            for product in low_stock[:5]:  # Show top 5
-                body += f"• {product.name}: {product.stock_level}/{product.min_stock_level}\n"
-            if len(low_stock) > 5:
-                body += f"  ... and {len(low_stock) - 5} more\n"
-            body += "\n"
-        
-        if expiring:
-            from models.product import Product
-            products_expiring = set()
-            for batch in expiring:
-                product = Product.objects(id=batch.product.id if hasattr(batch.product, 'id') else batch.product).first()
-                if product:
-                    products_expiring.add(product.name)
-
-            body += f"⏰ EXPIRATION ALERTS: {len(products_expiring)} products with expiring batches\n\n"
-            for batch in expiring[:5]:  # Show top 5
-                product = Product.objects(id=batch.product.id if hasattr(batch.product, 'id') else batch.product).first()
-                if product:
-                    exp_date = batch.expiration_date
-                    if isinstance(exp_date, datetime):
-                        exp_date = exp_date.date()
-                    days_until = (exp_date - date.today()).days
-                    body += f"• {product.name}: Batch #{batch.id} expires in {days_until} days\n"
-            if len(expiring) > 5:
-                body += f"  ... and {len(expiring) - 5} more batches\n"
+        today = date.today()
+        sections = (
+            (_daily_low_stock_section(low_stock) if low_stock else "")
+            + (_daily_expiring_section(expiring, today) if expiring else "")
+        )
         
-        body += """
-
-Please review the full reports in the StockaDoodle system.
-
---
-StockaDoodle Alert System
-"""
+        body = _DAILY_SUMMARY_BODY.substitute(
+            today=today.strftime('%A, %B %d, %Y'),
+            sections=sections,
+            footer=_ALERT_FOOTER
+        )
         
         sent_count = 0
         for manager in managers:
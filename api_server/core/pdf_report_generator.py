@@ -5,7 +5,10 @@ from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, 
     Image, PageBreak, KeepTogether, HRFlowable
 )
+from reportlab.lib.utils import ImageReader
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 import os
 from io import BytesIO
 
@@ -15,6 +18,44 @@ from utils.pdf_styles import(
 )
 
 
+# Repository root (api_server/core/ -> repo), so the logo is found
+# regardless of the directory the server was started from
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Candidate logo locations in order of preference, narrowed to the ones that
+# exist once at import
+_LOGO_PATHS = tuple(
+    path for path in (
+        os.path.join(_PROJECT_ROOT, PDFBranding.LOGO_PATH),
+        os.path.join(_PROJECT_ROOT, PDFBranding.LOGO_FALLBACK_PATH),
+        PDFBranding.LOGO_PATH,
+        PDFBranding.LOGO_FALLBACK_PATH,
+        "../desktop_app/assets/icons/stockadoodle-transparent.png",
+        "../../desktop_app/assets/icons/stockadoodle-transparent.png",
+    )
+    if os.path.exists(path)
+)
+
+
+@lru_cache(maxsize=1)
+def _load_logo():
+    """
+    Read the first usable logo once per process so each PDF skips the file
+    read. Returns the image bytes, or None if none is found.
+    Call _load_logo.cache_clear() after replacing the asset.
+    """
+    for logo_path in _LOGO_PATHS:
+        try:
+            with open(logo_path, 'rb') as logo_file:
+                data = logo_file.read()
+            ImageReader(BytesIO(data))  # make sure reportlab can decode it
+            return data
+        except Exception as e:
+            print(f"Logo loading failed from {logo_path}: {e}")
+            continue
+    return None
+
+
 def _footer_canvas(canvas, doc):
     """Draw footer on every page at the bottom"""
     canvas.saveState()
@@ -91,27 +132,13 @@ class PDFReportGenerator:
     
     def _add_professional_header(self, elements):
         """Add professional header with logo and company branding"""
-        # Add company logo - try multiple paths
-        logo_paths = [
-            PDFBranding.LOGO_PATH,
-            PDFBranding.LOGO_FALLBACK_PATH,
-            "../desktop_app/assets/icons/stockadoodle-transparent.png",
-            "../../desktop_app/assets/icons/stockadoodle-transparent.png",
-        ]
-        
-        logo_added = False
-        for logo_path in logo_paths:
-            if os.path.exists(logo_path):
-                try:
-                    logo = Image(logo_path, width=1.5*inch, height=1.5*inch)
-                    logo.hAlign = 'CENTER'
-                    elements.append(logo)
-                    elements.append(PDFLayoutHelpers.create_spacer(0.1))
-                    logo_added = True
-                    break
-                except Exception as e:
-                    print(f"Logo loading failed from {logo_path}: {e}")
-                    continue
+        # Add company logo (resolved and read once, see _load_logo)
+        logo_data = _load_logo()
+        if logo_data is not None:
+            logo = Image(BytesIO(logo_data), width=1.5*inch, height=1.5*inch)
+            logo.hAlign = 'CENTER'
+            elements.append(logo)
+            elements.append(PDFLayoutHelpers.create_spacer(0.1))
         
         # Company name
         company_para = Paragraph(
@@ -208,7 +235,7 @@ class PDFReportGenerator:
             
             sales_data = [['Sale ID', 'Date', 'Product', 'Qty', 'Price', 'Retailer']]
             
-            for sale in report_data['sales'][:50]:  # Limit to 50 for PDF
+            for sale in islice(report_data['sales'], 50):  # Limit to 50 for PDF
                 sales_data.append([
                     str(sale.get('sale_id', 'N/A')),
                     sale.get('date', 'N/A')[:10],
@@ -424,7 +451,7 @@ class PDFReportGenerator:
         elements.append(Paragraph("Activity Log", self.styles['section']))
         log_data = [['Log ID', 'Product', 'Action', 'Manager', 'Date/Time']]
         
-        for log in report_data['logs'][:100]:  # Limit to 100
+        for log in islice(report_data['logs'], 100):  # Limit to 100
             log_data.append([
                 str(log['log_id']),
                 log['product_name'][:25],
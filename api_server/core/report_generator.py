@@ -6,6 +6,107 @@ from models.retailer_metrics import RetailerMetrics
 from models.product_log import ProductLog
 from models.stock_batch import StockBatch
 from datetime import datetime, date, timedelta
+from mongoengine import signals
+from config import Config
+from utils.cache import TTLCache, ttl_cached
+
+# Reports are read-heavy and polled by dashboards, so results are kept for a
+# short while. Saves, deletes and bulk inserts of the models below clear the
+# cache; queryset .update()/update_one() writes fire no signals, so anything
+# changed that way can be stale for up to REPORT_CACHE_TTL seconds
+_report_cache = TTLCache(maxsize=Config.REPORT_CACHE_SIZE, ttl=Config.REPORT_CACHE_TTL)
+
+
+def _invalidate_report_cache(sender, document=None, **kwargs):
+    _report_cache.clear()
+
+
+for _model in (Sale, Product, Category, StockBatch, ProductLog, User, RetailerMetrics):
+    signals.post_save.connect(_invalidate_report_cache, sender=_model)
+    signals.post_delete.connect(_invalidate_report_cache, sender=_model)
+    signals.post_bulk_insert.connect(_invalidate_report_cache, sender=_model)
+
+
+def _to_cents(amount):
+    """Aggregation expression rounding a money field to whole cents"""
+    return {'$round': [{'$multiply': [amount, 100]}, 0]}
+
+
+# Aggregation pipelines that don't depend on report arguments are built once
+# at import time rather than on every report call
+
+# Report 1/6 totals from the raw sales
+_SALES_TOTALS_PIPELINE = [
+    {'$unwind': '$items'},
+    # One row per sale first, so each sale counts as one transaction
+    {'$group': {
+        '_id': '$_id',
+        'income_cents': {'$sum': _to_cents('$items.line_total')},
+        'quantity': {'$sum': '$items.quantity'}
+    }},
+    {'$group': {
+        '_id': None,
+        'total_income_cents': {'$sum': '$income_cents'},
+        'total_quantity': {'$sum': '$quantity'},
+        'total_transactions': {'$sum': 1}
+    }}
+]
+
+# Report 2: one grouped pass over products joined with their batches, instead
+# of a stock_level query per product per category
+_CATEGORY_STOCK_PIPELINE = [
+    {'$lookup': {
+        'from': StockBatch._get_collection_name(),
+        'localField': '_id',
+        'foreignField': 'product_id',
+        'as': 'batches'
+    }},
+    {'$group': {
+        '_id': '$category_id',
+        'products_count': {'$sum': 1},
+        'stock': {'$sum': {'$sum': '$batches.quantity'}}
+    }}
+]
+
+# Report 3: walk the metrics in leaderboard order so the sort is served by the
+# (current_streak, total_sales) index, joining in each retailer; the profile
+# picture is reduced to a flag so the image bytes never leave the db
+_RETAILER_PERFORMANCE_PIPELINE = [
+    {'$sort': {'current_streak': -1, 'total_sales': -1}},
+    {'$lookup': {
+        'from': User._get_collection_name(),
+        'let': {'retailer_id': '$retailer'},
+        'pipeline': [
+            {'$match': {
+                '$expr': {'$eq': ['$_id', '$$retailer_id']},
+                'role': {'$in': ['retailer', 'staff']}
+            }},
+            {'$project': {
+                'full_name': 1,
+                'has_profile_pic': {'$ne': [{'$ifNull': ['$user_image', None]}, None]}
+            }}
+        ],
+        'as': 'user'
+    }},
+    {'$unwind': '$user'}
+]
+
+# Report 7 user listing
+_USER_ACCOUNTS_PIPELINE = [
+    {'$sort': {'full_name': 1}},
+    {'$project': {
+        'username': 1,
+        'full_name': 1,
+        'role': 1,
+        'has_profile_pic': {'$ne': [{'$ifNull': ['$user_image', None]}, None]}
+    }}
+]
+
+# Report 7 role counts
+_ROLE_COUNTS_PIPELINE = [
+    {'$group': {'_id': '$role', 'count': {'$sum': 1}}}
+]
+
 
 class ReportGenerator:
     """
@@ -14,6 +115,73 @@ class ReportGenerator:
     """
 
     @staticmethod
+    @ttl_cached(_report_cache)
+    def _sale_lines(start_datetime=None, end_datetime=None):
+        """
+        Flatten the sales in a datetime range into one row per sold item,
+        newest first. Reports 1 and 6 both read from this, so a date range
+        is only fetched once while it stays cached.
+        """
+        sales = Sale.objects()
+        if start_datetime:
+            sales = sales.filter(created_at__gte=start_datetime)
+        if end_datetime:
+            sales = sales.filter(created_at__lte=end_datetime)
+        sales = list(sales.order_by('-created_at'))
+
+        # Resolve retailers and products in bulk instead of once per line
+        retailer_ids = list({sale.retailer_id for sale in sales})
+        product_ids = list({item.product_id for sale in sales for item in sale.items})
+        retailers = {
+            user.id: user.full_name
+            for user in User.objects(id__in=retailer_ids).only('id', 'full_name')
+        }
+        products = {
+            product.id: product
+            for product in Product.objects(id__in=product_ids).only('id', 'name', 'brand')
+        }
+
+        lines = []
+        for sale in sales:
+            for item in sale.items:
+                product = products.get(item.product_id)
+                lines.append({
+                    'sale_id': sale.id,
+                    'created_at': sale.created_at,
+                    'retailer_id': sale.retailer_id,
+                    'retailer_name': retailers.get(sale.retailer_id),
+                    'product_id': item.product_id,
+                    'product_name': product.name if product else None,
+                    'product_brand': product.brand if product else None,
+                    'quantity': item.quantity,
+                    'line_total': item.line_total
+                })
+        return lines
+
+    @staticmethod
+    @ttl_cached(_report_cache)
+    def _sales_summary(start_datetime=None, end_datetime=None):
+        """
+        Total income, quantity sold and transaction count for a datetime
+        range, reduced inside MongoDB instead of over the sale lines.
+        Money is summed as whole cents so the float line totals don't drift.
+        """
+        sales = Sale.objects()
+        if start_datetime:
+            sales = sales.filter(created_at__gte=start_datetime)
+        if end_datetime:
+            sales = sales.filter(created_at__lte=end_datetime)
+
+        totals = next(sales.aggregate(_SALES_TOTALS_PIPELINE), None)
+
+        return {
+            'total_income': int(totals['total_income_cents']) / 100 if totals else 0.0,
+            'total_quantity': totals['total_quantity'] if totals else 0,
+            'total_transactions': totals['total_transactions'] if totals else 0
+        }
+
+    @staticmethod
+    @ttl_cached(_report_cache)
     def sales_performance_report(start_date=None, end_date=None):
         """
         Report 1: Sales Performance Report for a Selected Date Range
@@ -40,36 +208,22 @@ class ReportGenerator:
             last_sale = sales.order_by('-created_at').first()
             end_date = last_sale.created_at.date() if last_sale else None
 
-        if start_date:
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            sales = sales.filter(created_at__gte=start_datetime) 
-        if end_date:
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-            sales = sales.filter(created_at__lte=end_datetime) 
-        
-        # Query sales
-        sales = sales.order_by('-created_at')
+        start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
+        end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
 
-        results = []
-        for sale in sales:
-            retailer = User.objects(id=sale.retailer_id).first()
-            items = sale.items
-            
-            for item in items:
-                product = Product.objects(id=item.product_id).first()
-                results.append({
-                    'sale_id': sale.id,
-                    'date': sale.created_at.isoformat(),
-                    'product_name': product.name if product else 'Unknown',
-                    'quantity_sold': item.quantity,
-                    'total_price': item.line_total,
-                    'retailer_name': retailer.full_name if retailer else 'Unknown'
-                })
-
-        total_income = sum(r['total_price'] for r in results)
-        total_quantity = sum(r['quantity_sold'] for r in results)
-        unique_sales = len(set(r['sale_id'] for r in results))
+        results = [
+            {
+                'sale_id': line['sale_id'],
+                'date': line['created_at'].isoformat(),
+                'product_name': line['product_name'] or 'Unknown',
+                'quantity_sold': line['quantity'],
+                'total_price': line['line_total'],
+                'retailer_name': line['retailer_name'] or 'Unknown'
+            }
+            for line in ReportGenerator._sale_lines(start_datetime, end_datetime)
+        ]
 
+        summary = ReportGenerator._sales_summary(start_datetime, end_datetime)
 
         return {
             'report_id': 1,
@@ -80,13 +234,14 @@ class ReportGenerator:
             },
             'sales': results,
             'summary': {
-                'total_income': round(total_income, 2),
-                'total_quantity_sold': total_quantity,
-                'total_transactions': unique_sales
+                'total_income': summary['total_income'],
+                'total_quantity_sold': summary['total_quantity'],
+                'total_transactions': summary['total_transactions']
             }
         }
 
     @staticmethod
+    @ttl_cached(_report_cache)
     def category_distribution_report():
         """
         Report 2: Category Distribution Report
@@ -97,17 +252,18 @@ class ReportGenerator:
         Returns:
             dict: Category-wise stock distribution
         """
-        categories = Category.objects()
-        
+        categories = Category.objects().only('id', 'name')
+
+        stats = {row['_id']: row for row in Product.objects.aggregate(_CATEGORY_STOCK_PIPELINE)}
+
         # Calculate total stock across all products
-        all_products = Product.objects()
-        total_stock = sum(product.stock_level for product in all_products)
+        total_stock = sum(row['stock'] for row in stats.values())
 
         category_data = []
         for category in categories:
-            products = Product.objects(category_id=category.id)
-            products_count = products.count()
-            category_stock = sum(p.stock_level for p in products)
+            row = stats.get(category.id, {})
+            products_count = row.get('products_count', 0)
+            category_stock = row.get('stock', 0)
             percentage = (category_stock / total_stock * 100) if total_stock > 0 else 0
 
             category_data.append({
@@ -123,12 +279,13 @@ class ReportGenerator:
             'report_name': 'Category Distribution Report',
             'categories': category_data,
             'summary': {
-                'total_categories': categories.count(),
+                'total_categories': len(category_data),
                 'total_stock': total_stock
             }
         }
 
     @staticmethod
+    @ttl_cached(_report_cache)
     def retailer_performance_report():
         """
         Report 3: Retailer Performance Report
@@ -139,39 +296,35 @@ class ReportGenerator:
         Returns:
             dict: All retailers with performance metrics
         """
-        retailers = User.objects(role__in=['retailer', 'staff'])
-        
         performance_data = []
-        for retailer in retailers:
-            metrics = RetailerMetrics.objects(retailer=retailer).first()
-            
-            if metrics:
-                quota_progress = (metrics.sales_today / metrics.daily_quota * 100) if metrics.daily_quota > 0 else 0
-                performance_data.append({
-                    'retailer_name': retailer.full_name,
-                    'user_id': retailer.id,
-                    'daily_quota': metrics.daily_quota,
-                    'current_sales': metrics.sales_today,
-                    'quota_progress': round(quota_progress, 2),
-                    'streak_count': metrics.current_streak,
-                    'total_sales': metrics.total_sales,
-                    'has_profile_pic': retailer.user_image is not None
-                })
-
-        # Sort by streak, then sales
-        performance_data.sort(key=lambda x: (x['streak_count'], x['total_sales']), reverse=True)
+        for metrics in RetailerMetrics.objects.aggregate(_RETAILER_PERFORMANCE_PIPELINE):
+            user = metrics['user']
+            daily_quota = metrics.get('daily_quota', 0.0)
+            sales_today = metrics.get('sales_today', 0.0)
+            quota_progress = (sales_today / daily_quota * 100) if daily_quota > 0 else 0
+            performance_data.append({
+                'retailer_name': user['full_name'],
+                'user_id': user['_id'],
+                'daily_quota': daily_quota,
+                'current_sales': sales_today,
+                'quota_progress': round(quota_progress, 2),
+                'streak_count': metrics.get('current_streak', 0),
+                'total_sales': metrics.get('total_sales', 0.0),
+                'has_profile_pic': user['has_profile_pic']
+            })
 
         return {
             'report_id': 3,
             'report_name': 'Retailer Performance Report',
             'retailers': performance_data,
             'summary': {
-                'total_retailers': retailers.count(),
+                'total_retailers': User.objects(role__in=['retailer', 'staff']).count(),
                 'active_today': len([r for r in performance_data if r['current_sales'] > 0])
             }
         }
 
     @staticmethod
+    @ttl_cached(_report_cache)
     def low_stock_and_expiration_alert_report(days_ahead=7):
         """
         Report 4: Low-Stock and Expiration Alert Report
@@ -185,46 +338,82 @@ class ReportGenerator:
         Returns:
             dict: Products needing attention
         """
-        products = Product.objects()
         alerts = []
+        critical_count = 0
 
         cutoff_date = date.today() + timedelta(days=days_ahead)
+        # DateField values are stored as datetimes, so compare against one
+        cutoff_datetime = datetime.combine(cutoff_date, datetime.min.time())
+
+        # Compute stock and earliest expiry per product in the database and
+        # return only the products that actually need an alert
+        pipeline = [
+            {'$project': {'name': 1, 'min_stock_level': 1}},
+            {'$lookup': {
+                'from': StockBatch._get_collection_name(),
+                'localField': '_id',
+                'foreignField': 'product_id',
+                'as': 'batches'
+            }},
+            {'$project': {
+                'name': 1,
+                # older documents may lack the field; use the model default
+                'min_stock_level': {'$ifNull': [
+                    '$min_stock_level', Product.min_stock_level.default
+                ]},
+                'current_stock': {'$sum': '$batches.quantity'},
+                'earliest_expiry': {'$min': {'$map': {
+                    'input': {'$filter': {
+                        'input': '$batches',
+                        'as': 'b',
+                        'cond': {'$and': [
+                            {'$gt': ['$$b.quantity', 0]},
+                            {'$ne': [{'$ifNull': ['$$b.expiration_date', None]}, None]},
+                            {'$lte': ['$$b.expiration_date', cutoff_datetime]}
+                        ]}
+                    }},
+                    'as': 'b',
+                    'in': '$$b.expiration_date'
+                }}}
+            }},
+            {'$match': {'$or': [
+                {'$expr': {'$lt': ['$current_stock', '$min_stock_level']}},
+                {'earliest_expiry': {'$ne': None}}
+            ]}},
+            {'$sort': {'name': 1}}
+        ]
 
-        for product in products:
-            stock = product.stock_level
+        for row in Product.objects.aggregate(pipeline):
+            stock = row['current_stock']
+            min_stock_level = row['min_stock_level']
             alert_status = []
 
             # Low stock check
-            if stock < product.min_stock_level:
+            if stock < min_stock_level:
                 if stock == 0:
                     alert_status.append("OUT_OF_STOCK")
                 else:
                     alert_status.append("LOW_STOCK")
 
             # Expiration check
-            expiring_batches = StockBatch.objects(
-                product_id=product.id,
-                expiration_date__lte=cutoff_date,
-                expiration_date__ne=None,
-                quantity__gt=0
-            )
-
-
-            if expiring_batches.count() > 0:
+            earliest_expiry = row.get('earliest_expiry')
+            if earliest_expiry:
                 alert_status.append("EXPIRING_SOON")
-                earliest_expiry = min(batch.expiration_date for batch in expiring_batches)
-            else:
-                earliest_expiry = None
+                # raw aggregation rows carry the stored datetime, not a date
+                earliest_expiry = earliest_expiry.date()
 
             if alert_status:
+                severity = 'CRITICAL' if 'OUT_OF_STOCK' in alert_status else 'WARNING'
+                if severity == 'CRITICAL':
+                    critical_count += 1
                 alerts.append({
-                    'product_id': product.id,
-                    'product_name': product.name,
+                    'product_id': row['_id'],
+                    'product_name': row['name'],
                     'current_stock': stock,
-                    'min_stock_level': product.min_stock_level,
+                    'min_stock_level': min_stock_level,
                     'expiration_date': earliest_expiry.isoformat() if earliest_expiry else None,
                     'alert_status': ', '.join(alert_status),
-                    'severity': 'CRITICAL' if 'OUT_OF_STOCK' in alert_status else 'WARNING'
+                    'severity': severity
                 })
 
         return {
@@ -233,12 +422,13 @@ class ReportGenerator:
             'alerts': alerts,
             'summary': {
                 'total_alerts': len(alerts),
-                'critical_alerts': len([a for a in alerts if a['severity'] == 'CRITICAL']),
-                'warning_alerts': len([a for a in alerts if a['severity'] == 'WARNING'])
+                'critical_alerts': critical_count,
+                'warning_alerts': len(alerts) - critical_count
             }
         }
 
     @staticmethod
+    @ttl_cached(_report_cache)
     def managerial_activity_log_report(start_date=None, end_date=None):
         """
         Report 5: Managerial Activity Log Report
@@ -261,33 +451,47 @@ class ReportGenerator:
         start_datetime = datetime.combine(start_date, datetime.min.time())
         end_datetime = datetime.combine(end_date, datetime.max.time())
 
-        # Get all product logs from managers/admins
-        all_logs = ProductLog.objects(
-            log_time__gte=start_datetime,
-            log_time__lte=end_datetime
-        ).order_by('-log_time')
+        # Resolve the managers/admins first so the log query can use the
+        # (user, log_time) index instead of checking every log's author
+        managers = {
+            user.id: user.full_name
+            for user in User.objects(role__in=['admin', 'manager']).only('id', 'full_name')
+        }
+
+        # Get all product logs from managers/admins, keeping the user
+        # reference undereferenced since the names are already known
+        all_logs = list(
+            ProductLog.objects(
+                user__in=list(managers),
+                log_time__gte=start_datetime,
+                log_time__lte=end_datetime
+            )
+            .no_dereference()
+            .order_by('-log_time')
+        )
+
+        product_names = {
+            product.id: product.name
+            for product in Product.objects(
+                id__in=list({log.product_id for log in all_logs})
+            ).only('id', 'name')
+        }
 
         results = []
         unique_managers = set()
         
         for log in all_logs:
-            if hasattr(log.user, 'id'):  
-                user_id = log.user.id  
-            else:  
-                user_id = log.user  
-            user = User.objects(id=user_id).first()
-            if user and user.role in ['admin', 'manager']:
-                product = Product.objects(id=log.product_id).first()
-                results.append({
-                    'log_id': log.id,
-                    'product_name': product.name if product else 'Unknown',
-                    'action_performed': log.action_type,
-                    'manager_id': user.id,
-                    'manager_name': user.full_name,
-                    'date_time': log.log_time.isoformat(),
-                    'notes': log.notes
-                })
-                unique_managers.add(user.id)
+            user_id = log.user.id
+            results.append({
+                'log_id': log.id,
+                'product_name': product_names.get(log.product_id, 'Unknown'),
+                'action_performed': log.action_type,
+                'manager_id': user_id,
+                'manager_name': managers[user_id],
+                'date_time': log.log_time.isoformat(),
+                'notes': log.notes
+            })
+            unique_managers.add(user_id)
 
         return {
             'report_id': 5,
@@ -304,6 +508,7 @@ class ReportGenerator:
         }
 
     @staticmethod
+    @ttl_cached(_report_cache)
     def detailed_sales_transaction_report(start_date=None, end_date=None):
         """
         Report 6: Detailed Sales Transaction Report
@@ -319,46 +524,35 @@ class ReportGenerator:
             dict: Detailed transaction list
         """
         
-        sales = Sale.objects()  
-      
-        sales = Sale.objects()  
-      
-        if start_date:  
-            sales = sales.filter(created_at__gte=start_date)  
-        if end_date:  
-            sales = sales.filter(created_at__lte=end_date)  
-      
+        # Same inclusive whole-day range as Report 1, so both reports share
+        # the cached sale lines for a given date range
+        start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
+        end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
+
         transactions = []  
-        total_revenue = 0.0  
-        total_items = 0  
         
-        for sale in sales:  
-            retailer = User.objects(id=sale.retailer_id).first()  
+        for line in ReportGenerator._sale_lines(start_datetime, end_datetime):  
+            # Calculate unit price from line total and quantity  
+            unit_price = line['line_total'] / line['quantity'] if line['quantity'] > 0 else 0  
             
-            # Process each embedded item as a separate transaction line  
-            for item in sale.items:  
-                product = Product.objects(id=item.product_id).first()  
-                
-                # Calculate unit price from line total and quantity  
-                unit_price = item.line_total / item.quantity if item.quantity > 0 else 0  
-                
-                transaction_data = {  
-                    'sale_id': sale.id,  
-                    'transaction_time': sale.created_at.strftime('%Y-%m-%d %H:%M:%S'),  
-                    'product_id': item.product_id,  
-                    'product_name': product.name if product else 'Unknown Product',  
-                    'product_brand': product.brand if product else '',  
-                    'quantity_sold': item.quantity,  
-                    'unit_price': round(unit_price, 2),  
-                    'line_total': item.line_total,  
-                    'retailer_id': sale.retailer_id,  
-                    'retailer_name': retailer.full_name if retailer else 'Unknown'  
-                }  
-                
-                transactions.append(transaction_data)  
-                total_revenue += item.line_total  
-                total_items += item.quantity  
-      
+            transaction_data = {  
+                'sale_id': line['sale_id'],  
+                'transaction_time': line['created_at'].strftime('%Y-%m-%d %H:%M:%S'),  
+                'product_id': line['product_id'],  
+                'product_name': line['product_name'] or 'Unknown Product',  
+                'product_brand': line['product_brand'] or '',  
+                'quantity_sold': line['quantity'],  
+                'unit_price': round(unit_price, 2),  
+                'line_total': line['line_total'],  
+                'retailer_id': line['retailer_id'],  
+                'retailer_name': line['retailer_name'] or 'Unknown'  
+            }  
+            
+            transactions.append(transaction_data)  
+
+        # Totals come from the cents-exact aggregation shared with Report 1
+        summary = ReportGenerator._sales_summary(start_datetime, end_datetime)
+  
         return {  
             'report_id': 6,  
             'report_name': 'Detailed Sales Transaction Report',  
@@ -368,14 +562,15 @@ class ReportGenerator:
             },  
             'summary': {  
                 'total_transactions': len(transactions),  
-                'total_sales_count': len(set(t['sale_id'] for t in transactions)),  
-                'total_revenue': round(total_revenue, 2),  
-                'total_items_sold': total_items  
+                'total_sales_count': summary['total_transactions'],  
+                'total_revenue': summary['total_income'],  
+                'total_items_sold': summary['total_quantity']  
             },  
             'transactions': transactions  
         }
 
     @staticmethod
+    @ttl_cached(_report_cache)
     def user_accounts_report():
         """
         Report 7: User Accounts Report
@@ -386,26 +581,34 @@ class ReportGenerator:
         Returns:
             dict: All user accounts with details
         """
-        users = User.objects().order_by('full_name')
+        # Project only the listed columns; user_image is reduced to a flag
+        # in the database so the image bytes never leave it
+        users = User.objects().aggregate(_USER_ACCOUNTS_PIPELINE)
+
+        # One grouped count instead of a query per role
+        role_counts = {
+            row['_id']: row['count']
+            for row in User.objects().aggregate(_ROLE_COUNTS_PIPELINE)
+        }
 
         return {
             'report_id': 7,
             'report_name': 'User Accounts Report',
             'users': [
                 {
-                    'user_id': user.id,
-                    'username': user.username,
-                    'full_name': user.full_name,
-                    'role': user.role,
+                    'user_id': user['_id'],
+                    'username': user.get('username'),
+                    'full_name': user.get('full_name'),
+                    'role': user.get('role'),
                     'account_status': 'Active',  # Extend User model if needed
-                    'has_profile_pic': user.user_image is not None
+                    'has_profile_pic': user['has_profile_pic']
                 }
                 for user in users
             ],
             'summary': {
-                'total_users': users.count(),
-                'admins': User.objects(role='admin').count(),
-                'managers': User.objects(role='manager').count(),
-                'retailers': User.objects(role__in=['retailer', 'staff']).count()
+                'total_users': sum(role_counts.values()),
+                'admins': role_counts.get('admin', 0),
+                'managers': role_counts.get('manager', 0),
+                'retailers': role_counts.get('retailer', 0) + role_counts.get('staff', 0)
             }
         }
\ No newline at end of file
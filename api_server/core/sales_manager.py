@@ -2,6 +2,8 @@ from utils.counters import get_next_sequence
 from models.sale import Sale, SaleItem
 from models.product import Product
 from models.retailer_metrics import RetailerMetrics
+from models.stock_batch import StockBatch
+from models.user import User
 from core.inventory_manager import InventoryManager, InventoryError
 from core.activity_logger import ActivityLogger
 from datetime import datetime, date, timedelta, timezone
@@ -103,11 +105,7 @@ class SalesManager:
             retailer_id (int): Retailer ID
             sale_amount (float): Amount of the sale
         """
-        from models.retailer_metrics import RetailerMetrics  
-        from models.user import User  
-        from datetime import date  
-        
-        user = User.objects(id=retailer_id).first()
+        user = User.objects(id=retailer_id).only('id').first()
         if not user:  
             return
         
@@ -171,7 +169,6 @@ class SalesManager:
         try:
             # Restore stock for each item (add back as new batches)
             for item in sale.items:
-                from models.stock_batch import StockBatch
                 batch = StockBatch(
                     product_id=item.product_id,
                     quantity=item.quantity,
@@ -270,8 +267,7 @@ class SalesManager:
         Returns:
             dict: Retailer performance data
         """
-        from models.user import User
-        user = User.objects(id=retailer_id).first()
+        user = User.objects(id=retailer_id).only('id').first()
         if not user:
             raise SalesError(f"Retailer ID {retailer_id} not found")
         metrics = RetailerMetrics.objects(retailer=user).first()
@@ -312,24 +308,29 @@ class SalesManager:
         Returns:
             list: Top retailers with performance data
         """
-        from models.user import User
         
-        # Get all valid User IDs first  
-        valid_user_ids = [user.id for user in User.objects()]
+        # Get all valid User IDs and names first, without the image bytes
+        retailer_names = {
+            user.id: user.full_name
+            for user in User.objects().only('id', 'full_name')
+        }
         
+        # no_dereference keeps each retailer as a plain reference instead of
+        # loading the whole User document again
         top_metrics = (
-            RetailerMetrics.objects(retailer__in=valid_user_ids)
+            RetailerMetrics.objects(retailer__in=list(retailer_names))
+            .no_dereference()
             .order_by('-current_streak', '-total_sales')
             .limit(limit)
         )
 
         leaderboard = []
         for idx, metrics in enumerate(top_metrics, 1):
-            user = metrics.retailer
+            retailer_id = metrics.retailer.id if metrics.retailer else None
             leaderboard.append({
                 'rank': idx,
-                'retailer_id': metrics.retailer.id if metrics.retailer else None,
-                'retailer_name': user.full_name if user else 'Unknown',
+                'retailer_id': retailer_id,
+                'retailer_name': retailer_names.get(retailer_id, 'Unknown'),
                 'current_streak': metrics.current_streak,
                 'total_sales': metrics.total_sales,
                 'sales_today': metrics.sales_today,
@@ -356,8 +357,7 @@ class SalesManager:
         if new_quota < 0:
             raise SalesError("Quota must be non-negative")
         
-        from models.user import User
-        user = User.objects(id=retailer_id).first()
+        user = User.objects(id=retailer_id).only('id').first()
     
         if not user:
             raise SalesError(f"Retailer ID {retailer_id} not found")
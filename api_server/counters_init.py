@@ -2,7 +2,7 @@
 One-time script to seed the counters collection.
 """
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from config import Config
 
 client = MongoClient(Config.MONGO_URI)
@@ -20,12 +20,18 @@ initial_counters = [
     {"_id": "saleitem_id", "seq": 0}    
 ]
 
-for counter in initial_counters:
-    db.counters.update_one(
-        {"_id": counter["_id"]},
-        {"$setOnInsert": counter},
-        upsert=True
-    )
+# one round trip for every counter instead of one per counter
+db.counters.bulk_write(
+    [
+        UpdateOne(
+            {"_id": counter["_id"]},
+            {"$setOnInsert": counter},
+            upsert=True
+        )
+        for counter in initial_counters
+    ],
+    ordered=False
+)
     
 print("All counters initialized successfully")
 print("-> Users starts at ID 1001")
@@ -1,5 +1,5 @@
 import mongoengine
-from utils.counters import get_next_sequence
+from utils.counters import get_next_sequence, reserve_sequence_range
 
 class BaseDocument(mongoengine.Document):
     meta = {
@@ -8,9 +8,35 @@ class BaseDocument(mongoengine.Document):
     }
     
     id = mongoengine.IntField(primary_key=True)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # counter key prefix, e.g. "product" -> "product_id"; resolved once per class
+        cls._counter_name = cls.__name__.lower()
     
     def save(self, *args, **kwargs):
         if self.id is None:
-            collection_name = self.__class__.__name__.lower()
-            self.id = get_next_sequence(collection_name)
-        super().save(*args, **kwargs)
\ No newline at end of file
+            self.id = get_next_sequence(self._counter_name)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def allocate_ids(cls, count):
+        """Reserve `count` IDs with a single counter update"""
+        return reserve_sequence_range(cls._counter_name, count)
+
+    @classmethod
+    def bulk_save(cls, docs):
+        """
+        Insert many new documents at once. IDs for the ones without one are
+        allocated in a single counter update instead of one per document.
+        """
+        docs = list(docs)
+        if not docs:
+            return []
+
+        missing = [doc for doc in docs if doc.id is None]
+        if missing:
+            for doc, new_id in zip(missing, cls.allocate_ids(len(missing))):
+                doc.id = new_id
+
+        return cls.objects.insert(docs)
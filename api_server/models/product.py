@@ -39,14 +39,35 @@ class Product(BaseDocument):
         from .category import Category
         return Category.objects(id=self.category_id).first()
 
-    def to_dict(self, include_image=False, include_batches=False):
+    @staticmethod
+    def stock_levels(product_ids):
+        from .stock_batch import StockBatch
+        # total stock of many products in one grouped query
+        levels = {product_id: 0 for product_id in product_ids}
+        rows = StockBatch.objects(product_id__in=list(levels)).aggregate([
+            {'$group': {'_id': '$product_id', 'stock': {'$sum': '$quantity'}}}
+        ])
+        for row in rows:
+            levels[row['_id']] = row['stock']
+        return levels
+
+    def to_dict(self, include_image=False, include_batches=False,
+                category_names=None, stock_levels=None):
+        # category_names / stock_levels are optional prefetched lookups
+        # (id -> value) so listing many products skips the per-product queries
+        if category_names is not None:
+            category_name = category_names.get(self.category_id)
+        else:
+            category = self.category
+            category_name = category.name if category else None
+
         data = {
             "id": self.id,
             "name": self.name,
             "brand": self.brand or "",
             "price": self.price,
-            "category": self.category.name if self.category else None,
-            "stock_level": self.stock_level,
+            "category": category_name,
+            "stock_level": stock_levels[self.id] if stock_levels is not None else self.stock_level,
             "min_stock_level": self.min_stock_level,
             "details": self.details or "",
             "has_image": bool(self.product_image)
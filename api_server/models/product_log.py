@@ -6,7 +6,11 @@ from datetime import datetime, timezone
 class ProductLog(BaseDocument):
     meta = {
         'collection': 'product_logs',
-        'ordering': ['-log_time']
+        'ordering': ['-log_time'],
+        'indexes': [
+            ('user', '-log_time'),  # activity of given users over a date range
+            '-log_time'
+        ]
     }
 
     # product related to the log
@@ -6,7 +6,10 @@ from datetime import date, datetime, timezone
 class RetailerMetrics(BaseDocument):
     meta = {
         'collection': 'retailer_metrics',
-        'ordering': ['retailer']
+        'ordering': ['retailer'],
+        'indexes': [
+            ('-current_streak', '-total_sales')  # leaderboard order
+        ]
         }
 
     # which retailer this belongs to
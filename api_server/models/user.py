@@ -6,7 +6,8 @@ from datetime import datetime, timezone
 class User(BaseDocument):
     meta = {
         'collection': 'users',
-        'ordering': ['username']
+        'ordering': ['username'],
+        'indexes': ['role']
         }
     
     # full name for display
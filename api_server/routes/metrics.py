@@ -15,7 +15,7 @@ bp = Blueprint('metrics', __name__)
 def get_retailer_metrics(user_id):
     """Get retailer's current performance metrics"""
     try:
-        user  = User.objects(id=user_id).first()
+        user  = User.objects(id=user_id).only('id', 'role').first()
         
         if not user:
             return jsonify({"errors": ["Retailer metrics not found"]}), 404
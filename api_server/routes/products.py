@@ -84,15 +84,29 @@ def list_product():
     # Pagination
     total = query.count()
     skip = (page - 1) * per_page
-    products = query.skip(skip).limit(per_page)
+    products = list(query.skip(skip).limit(per_page))
     pages = (total + per_page - 1) // per_page
+
+    # Load categories and stock for the whole page up front
+    category_names = {
+        c.id: c.name
+        for c in Category.objects(id__in=list({p.category_id for p in products})).only('id', 'name')
+    }
+    stock_levels = Product.stock_levels([p.id for p in products])
         
     return jsonify({
         "page": page,
         "per_page": per_page,
         "total": total,
         "pages": pages,
-        "products": [p.to_dict(include_image=include_image) for p in products]
+        "products": [
+            p.to_dict(
+                include_image=include_image,
+                category_names=category_names,
+                stock_levels=stock_levels
+            )
+            for p in products
+        ]
     })
     
     
@@ -0,0 +1,65 @@
+import threading
+import time
+from functools import wraps
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache whose entries expire after `ttl` seconds.
+    Once `maxsize` entries are stored the oldest one is evicted first.
+    """
+
+    def __init__(self, maxsize=128, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        """Store value under key for the next `ttl` seconds"""
+        with self._lock:
+            self._data.pop(key, None)
+            while len(self._data) >= self.maxsize:
+                # dicts keep insertion order, so the first key is the oldest
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._data.clear()
+
+
+def ttl_cached(cache):
+    """
+    Memoize a function in the given TTLCache, keyed on its name and arguments.
+    All arguments must be hashable.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
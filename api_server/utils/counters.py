@@ -18,3 +18,16 @@ def get_next_sequence(collection_name: str) -> int:
     )
     return updated['seq']
 
+
+def reserve_sequence_range(collection_name: str, count: int) -> range:
+    """
+    Atomically reserve `count` consecutive IDs for a collection in one update
+    """
+    key = f"{collection_name}_id"
+    updated = _db.counters.find_one_and_update(
+        {'_id': key},
+        {'$inc': {'seq': count}},
+        upsert=True,
+        return_document = ReturnDocument.AFTER
+    )
+    return range(updated['seq'] - count + 1, updated['seq'] + 1)
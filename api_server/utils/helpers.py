@@ -18,7 +18,8 @@ def get_image_binary():
     """
     Extract image binary data from:
     - multipart/form-data → file upload (field name: 'image')
-    - JSON or form-data → binary data (field name: 'image_data')
+    - JSON or form-data → binary data (field name: 'image_data'), or a
+      base64 data URI ("data:image/png;base64,...")
     Returns bytes or None
     """
     # 1. File upload
@@ -37,7 +38,14 @@ def get_image_binary():
             return raw
         # If it's a string representation, try to decode
         try:
-            return raw.encode('latin1') if isinstance(raw, str) else None
+            if not isinstance(raw, str):
+                return None
+            # data:image/...;base64,<payload> -- only the short header is scanned
+            # for the comma, never the multi-MB payload
+            comma = raw.find(",", 0, 64)
+            if comma != -1 and raw.startswith("data:image"):
+                return base64.b64decode(raw[comma + 1:])
+            return raw.encode('latin1')
         except Exception:
             return None
     return None
@@ -1,5 +1,6 @@
 import requests  
 import json  
+import base64  
 from typing import Optional, Dict, List, Any  
 from datetime import datetime  
   
@@ -53,6 +54,21 @@ class StockaDoodleAPI:
         except requests.exceptions.RequestException as e:  
             raise Exception(f"Connection error: {str(e)}")  
       
+    def _send_with_image(self, method: str, endpoint: str, data: Dict,
+                         image: Optional[Any] = None) -> Dict:
+        """
+        Send data as JSON, attaching the image as a base64 data URI in 'image_data'.
+
+        Kept as JSON (not multipart) so numbers, booleans and nulls reach the
+        server with their types; get_image_binary decodes the data URI.
+        """
+        if image:
+            if isinstance(image, bytes):
+                image = "data:image/*;base64," + base64.b64encode(image).decode('ascii')
+            data = dict(data, image_data=image)
+
+        return self._request(method, endpoint, json=data)
+
     # ================================================================  
     # AUTHENTICATION & USER MANAGEMENT  
     # ================================================================  
@@ -129,10 +145,7 @@ class StockaDoodleAPI:
             "role": role  
         }  
           
-        if user_image:
-            data['image_data'] = user_image
-          
-        return self._request("POST", "/users", json=data)  
+        return self._send_with_image("POST", "/users", data, user_image)  
       
     def update_user(self, user_id: int, **kwargs) -> Dict:  
         """Update user (partial)"""  
@@ -173,10 +186,7 @@ class StockaDoodleAPI:
             "description": description  
         }  
           
-        if category_image:
-            data['image_data'] = category_image
-          
-        return self._request("POST", "/categories", json=data)  
+        return self._send_with_image("POST", "/categories", data, category_image)  
       
     def update_category(self, category_id: int, **kwargs) -> Dict:  
         """Update category (partial)"""  
@@ -239,10 +249,7 @@ class StockaDoodleAPI:
         # Remove None values  
         data = {k: v for k, v in data.items() if v is not None}  
           
-        if product_image:
-            data['image_data'] = product_image
-          
-        return self._request("POST", "/products", json=data)  
+        return self._send_with_image("POST", "/products", data, product_image)  
       
     def update_product(self, product_id: int, **kwargs) -> Dict:  
         """Update product (partial)"""  
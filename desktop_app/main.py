@@ -7,11 +7,20 @@ Handles application setup, window management, and the main event loop.
 
 import sys
 import os
+import logging
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QPixmapCache
 
 from utils.config import AppConfig
-from ui.login_window import LoginWindow
+from utils.asset_cache import get_logo_icon
+from utils.styles import get_global_stylesheet
+
+# Quiet by default; set STOCKADOODLE_DEBUG=1 to see startup messages
+log = logging.getLogger("stockadoodle.main")
+log.addHandler(logging.NullHandler())
+if os.getenv("STOCKADOODLE_DEBUG"):
+    log.addHandler(logging.StreamHandler())
+    log.setLevel(logging.DEBUG)
 
 
 def main():
@@ -24,20 +33,30 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("StockaDoodle Inc.")
 
-    # Set window icon
-    icon_path = "../desktop_app/assets/icons/stockadoodle-transparent.png"
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    # Room for product thumbnails and other decoded images (Qt's default is 10 MB)
+    QPixmapCache.setCacheLimit(AppConfig.PIXMAP_CACHE_LIMIT_KB)
+
+    # One application-wide stylesheet (base widgets + card classes), parsed once
+    app.setStyleSheet(get_global_stylesheet())
+
+    # Set window icon (the logo is read once and shared with the windows)
+    icon = get_logo_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
 
     # Note: High DPI scaling is enabled by default in PyQt6
 
+    # Imported here so the window's widget/API-client imports run after the
+    # application is set up rather than when main.py is loaded
+    from ui.login_window import LoginWindow
+
     # Create and show login window
     login_window = LoginWindow()
 
     # Handle successful login
     def on_login_successful(user_data):
         """Handle successful login by transitioning to main application."""
-        print(f"Login successful for user: {user_data.get('username')}")
+        log.debug("Login successful for user: %s", user_data.get('username'))
         # TODO: Create and show main window here
         # main_window = MainWindow(user_data)
         # main_window.show()
@@ -7,18 +7,41 @@ Features:
 - MFA flow for Admin/Manager roles
 - Responsive design with proper error handling
 """
-import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit,
     QPushButton, QMessageBox, QSpacerItem, QSizePolicy
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap, QIcon
 
-from api_client.stockadoodle_api import StockaDoodleAPI
-from utils.helpers import get_feather_icon
+from utils.api_wrapper import get_api
+from utils.icons import get_icon
 from utils.styles import get_dialog_style
 from utils.config import AppConfig
+from utils.asset_cache import get_logo_icon, get_logo_pixmap
+from utils.workers import run_api_call
+
+# Label styles only depend on AppConfig constants, so they are formatted once
+# at import and applied as a single sheet on the window (matched by objectName)
+_LOGIN_QSS = f"""
+    QLabel#loginLogo {{
+        font-size: 32pt;
+        font-weight: bold;
+        color: #2563EB;
+    }}
+    QLabel#loginTitle {{
+        font-size: 24pt;
+        font-weight: bold;
+        color: {AppConfig.LIGHT_TEXT};
+    }}
+    QLabel#loginSubtitle {{
+        color: {AppConfig.TEXT_COLOR_ALT};
+        font-size: 12pt;
+    }}
+    QLabel#loginFooter {{
+        color: rgba(255,255,255,0.4);
+        font-size: 10pt;
+    }}
+"""
 
 
 class LoginWindow(QWidget):
@@ -32,16 +55,18 @@ class LoginWindow(QWidget):
         super().__init__(parent)
         self.setWindowTitle("StockaDoodle - Inventory Management System")
         self.setFixedSize(400, 600)
-        self.setStyleSheet(get_dialog_style())
+        self.setStyleSheet(get_dialog_style() + _LOGIN_QSS)
 
         # Set window icon
-        icon_path = "../desktop_app/assets/icons/stockadoodle-transparent.png"
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = get_logo_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
-        # Initialize API client
-        self.api_client = StockaDoodleAPI()
+        # Shared API client (one requests.Session for the whole app)
+        self.api_client = get_api()
         self.attempted_user = None
+        # Drag origin while the window is being moved by the mouse
+        self.old_pos = None
 
         self.init_ui()
 
@@ -53,28 +78,25 @@ class LoginWindow(QWidget):
 
         # Logo
         logo_label = QLabel()
-        logo_path = "../desktop_app/assets/icons/stockadoodle-transparent.png"
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path).scaled(
-                120, 120, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        logo_label.setObjectName("loginLogo")
+        # Decoded and smooth-scaled only the first time, then served from QPixmapCache
+        pixmap = get_logo_pixmap(120)
+        if not pixmap.isNull():
             logo_label.setPixmap(pixmap)
         else:
             logo_label.setText("StockaDoodle")
-            logo_label.setStyleSheet("font-size: 32pt; font-weight: bold; color: #2563EB;")
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(logo_label)
 
         # Title
         title = QLabel("Welcome Back!")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet(f"font-size: 24pt; font-weight: bold; color: {AppConfig.LIGHT_TEXT};")
+        title.setObjectName("loginTitle")
         main_layout.addWidget(title)
 
         subtitle = QLabel("Sign in to your StockaDoodle account")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet(f"color: {AppConfig.TEXT_COLOR_ALT}; font-size: 12pt;")
+        subtitle.setObjectName("loginSubtitle")
         main_layout.addWidget(subtitle)
 
         main_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, 
@@ -82,12 +104,14 @@ class LoginWindow(QWidget):
 
         # Username field
         self.username_input = QLineEdit()
+        self.username_input.setObjectName("usernameInput")
         self.username_input.setPlaceholderText("Username")
         self.username_input.setMinimumHeight(45)
         main_layout.addWidget(self.username_input)
 
         # Password field
         self.password_input = QLineEdit()
+        self.password_input.setObjectName("passwordInput")
         self.password_input.setPlaceholderText("Password")
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setMinimumHeight(45)
@@ -95,7 +119,8 @@ class LoginWindow(QWidget):
 
         # Login button
         self.login_btn = QPushButton("Sign In")
-        self.login_btn.setIcon(get_feather_icon("log-in", size=18))
+        self.login_btn.setObjectName("loginButton")
+        self.login_btn.setIcon(get_icon("log-in", size=18))
         self.login_btn.setMinimumHeight(50)
         self.login_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.login_btn.clicked.connect(self.handle_login)
@@ -104,7 +129,7 @@ class LoginWindow(QWidget):
         # Footer
         footer = QLabel("© 2025 StockaDoodle Inventory System")
         footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        footer.setStyleSheet(f"color: rgba(255,255,255,0.4); font-size: 10pt;")
+        footer.setObjectName("loginFooter")
         main_layout.addStretch()
         main_layout.addWidget(footer)
 
@@ -124,43 +149,45 @@ class LoginWindow(QWidget):
         self.login_btn.setEnabled(False)
         self.login_btn.setText("Signing in...")
 
-        try:
-            # Attempt login via API
-            result = self.api_client.login(username, password)
-
-            # Check if MFA is required
-            if result.get('mfa_required'):
-                # MFA required - build user dict from individual fields
-                self.attempted_user = {
-                    'id': result.get('user_id'),
-                    'username': result.get('username'),
-                    'role': result.get('role'),
-                    'email': result.get('email')
-                }
-                
-                if not self.attempted_user.get('username'):
-                    QMessageBox.critical(self, "Login Error", 
-                                       "Invalid login response from server.")
-                    self.reset_login_button()
-                    return
-
-                self.request_mfa()
+        # Authenticate on the thread pool so the window keeps repainting
+        run_api_call(self.api_client.login, username, password,
+                     on_result=self.on_login_result, on_error=self.on_login_error)
+
+    def on_login_result(self, result):
+        """Handle the login response (runs on the GUI thread)."""
+        # Check if MFA is required
+        if result.get('mfa_required'):
+            # MFA required - build user dict from individual fields
+            self.attempted_user = {
+                'id': result.get('user_id'),
+                'username': result.get('username'),
+                'role': result.get('role'),
+                'email': result.get('email')
+            }
+            
+            if not self.attempted_user.get('username'):
+                QMessageBox.critical(self, "Login Error", 
+                                   "Invalid login response from server.")
+                self.reset_login_button()
+                return
+
+            self.request_mfa()
+        else:
+            # Direct login successful (for staff/retailer)
+            user = result.get('user')
+            if user:
+                self.login_successful.emit(user)
+                self.close()
             else:
-                # Direct login successful (for staff/retailer)
-                user = result.get('user')
-                if user:
-                    self.login_successful.emit(user)
-                    self.close()
-                else:
-                    QMessageBox.critical(self, "Login Error", 
-                                       "Invalid login response from server.")
-                    self.reset_login_button()
-
-        except Exception as e:
-            error_msg = str(e)
-            QMessageBox.critical(self, "Login Failed", 
-                               f"Authentication failed:\n{error_msg}")
-            self.reset_login_button()
+                QMessageBox.critical(self, "Login Error", 
+                                   "Invalid login response from server.")
+                self.reset_login_button()
+
+    def on_login_error(self, error):
+        """Handle a failed login request (runs on the GUI thread)."""
+        QMessageBox.critical(self, "Login Failed", 
+                           f"Authentication failed:\n{error}")
+        self.reset_login_button()
 
     def request_mfa(self):
         """Initiate MFA flow for privileged users (Admin/Manager)."""
@@ -171,29 +198,30 @@ class LoginWindow(QWidget):
             self.reset_login_button()
             return
 
-        try:
-            # Send MFA code via API
-            result = self.api_client.send_mfa_code(
-                self.attempted_user['username'],
-                email
-            )
-
-            QMessageBox.information(
-                self,
-                "MFA Required",
-                f"A 6-digit verification code has been sent to {email}"
-            )
-
-            # Show MFA dialog
-            from ui.mfa_window import MFAWindow
-            mfa_dialog = MFAWindow(self.attempted_user, parent=self)
-            mfa_dialog.mfa_verified.connect(self.on_mfa_success)
-            mfa_dialog.exec()
-
-        except Exception as e:
-            QMessageBox.critical(self, "MFA Failed", 
-                               f"Could not send MFA code:\n{str(e)}")
-            self.reset_login_button()
+        # Send MFA code via API in the background (the server sends an email)
+        run_api_call(self.api_client.send_mfa_code,
+                     self.attempted_user['username'], email,
+                     on_result=self.on_mfa_code_sent, on_error=self.on_mfa_code_error)
+
+    def on_mfa_code_sent(self, result):
+        """Show the MFA dialog once the code has been sent."""
+        QMessageBox.information(
+            self,
+            "MFA Required",
+            f"A 6-digit verification code has been sent to {self.attempted_user.get('email')}"
+        )
+
+        # Show MFA dialog
+        from ui.mfa_window import MFAWindow
+        mfa_dialog = MFAWindow(self.attempted_user, parent=self)
+        mfa_dialog.mfa_verified.connect(self.on_mfa_success)
+        mfa_dialog.exec()
+
+    def on_mfa_code_error(self, error):
+        """Handle a failed send_mfa_code request."""
+        QMessageBox.critical(self, "MFA Failed", 
+                           f"Could not send MFA code:\n{error}")
+        self.reset_login_button()
 
     def on_mfa_success(self, verified_user):
         """Handle successful MFA verification."""
@@ -217,7 +245,7 @@ class LoginWindow(QWidget):
 
     def mouseMoveEvent(self, event):
         """Handle window dragging."""
-        if not hasattr(self, 'old_pos') or not self.old_pos:
+        if self.old_pos is None:
             return
         delta = event.globalPosition().toPoint() - self.old_pos
         self.move(self.pos() + delta)
@@ -13,13 +13,14 @@ from PyQt6.QtWidgets import (
     QPushButton, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
-import os
+from PyQt6.QtGui import QFont
 
-from api_client.stockadoodle_api import StockaDoodleAPI
+from utils.api_wrapper import get_api
 from utils.styles import get_dialog_style
-from utils.helpers import get_feather_icon
+from utils.icons import get_icon
 from utils.config import AppConfig
+from utils.asset_cache import get_logo_icon
+from utils.workers import run_api_call
 
 
 class MFAWindow(QDialog):
@@ -37,7 +38,9 @@ class MFAWindow(QDialog):
         """
         super().__init__(parent)
         self.user_data = user_data
-        self.api_client = StockaDoodleAPI()
+        self.api_client = get_api()
+        # Drag origin while the window is being moved by the mouse
+        self.old_pos = None
 
         self.setWindowTitle("Two-Factor Authentication")
         self.setFixedSize(380, 300)
@@ -45,9 +48,9 @@ class MFAWindow(QDialog):
         self.setModal(True)
 
         # Set window icon
-        icon_path = "../desktop_app/assets/icons/stockadoodle-transparent.png"
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = get_logo_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
         self.init_ui()
 
@@ -79,39 +82,39 @@ class MFAWindow(QDialog):
         self.code_input.setFont(QFont("Consolas", 18))
         self.code_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.code_input.setFixedHeight(60)
-        self.code_input.textChanged.connect(self.format_code_input)
+        self.code_input.textChanged.connect(self.on_code_changed)
         layout.addWidget(self.code_input)
 
         # Buttons
         btn_layout = QHBoxLayout()
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setIcon(get_feather_icon("x"))
+        cancel_btn.setIcon(get_icon("x"))
         cancel_btn.clicked.connect(self.reject)
 
-        verify_btn = QPushButton("Verify")
-        verify_btn.setIcon(get_feather_icon("check-circle"))
-        verify_btn.setDefault(True)
-        verify_btn.clicked.connect(self.verify_code)
+        self.verify_btn = QPushButton("Verify")
+        self.verify_btn.setIcon(get_icon("check-circle"))
+        self.verify_btn.setDefault(True)
+        self.verify_btn.clicked.connect(self.verify_code)
 
         btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(verify_btn)
+        btn_layout.addWidget(self.verify_btn)
         layout.addLayout(btn_layout)
 
-        # Auto-submit on 6 digits
-        self.code_input.textChanged.connect(self.check_auto_submit)
-
-    def format_code_input(self, text):
-        """Format code input - only allow digits."""
-        if not text.isdigit():
+    def on_code_changed(self, text):
+        """Keep the code digits-only and auto-submit once 6 digits are entered."""
+        if text and not text.isdigit():
+            # setText re-enters this handler with the cleaned code
             self.code_input.setText(''.join(filter(str.isdigit, text)))
+            return
 
-    def check_auto_submit(self):
-        """Auto-submit verification when 6 digits are entered."""
-        if len(self.code_input.text()) == 6:
+        if len(text) == 6:
             self.verify_code()
 
     def verify_code(self):
         """Verify the entered MFA code via API."""
+        if not self.verify_btn.isEnabled():
+            return  # A verification request is already in flight
+
         code = self.code_input.text().strip()
 
         if len(code) != 6 or not code.isdigit():
@@ -119,32 +122,51 @@ class MFAWindow(QDialog):
                               "Please enter a valid 6-digit code.")
             return
 
-        try:
-            # Verify MFA code via API
-            result = self.api_client.verify_mfa_code(
-                self.user_data['username'], 
-                code
-            )
-
-            user = result.get('user')
-            if user:
-                QMessageBox.information(self, "Success", 
-                                      "Authentication successful!")
-                self.mfa_verified.emit(user)
-                self.accept()
-            else:
-                QMessageBox.critical(self, "Verification Failed", 
-                                   "Invalid verification code. Please try again.")
-                self.code_input.clear()
-                self.code_input.setFocus()
-
-        except Exception as e:
-            error_msg = str(e)
-            QMessageBox.critical(self, "Verification Failed",
-                               f"Code verification failed:\n{error_msg}")
+        # Verify MFA code via API on a worker thread so the dialog keeps painting
+        self.set_verifying(True)
+        run_api_call(
+            self.api_client.verify_mfa_code,
+            self.user_data['username'],
+            code,
+            on_result=self.on_verify_result,
+            on_error=self.on_verify_error
+        )
+
+    def on_verify_result(self, result):
+        """Handle the verify_mfa_code response (GUI thread)."""
+        self.set_verifying(False)
+        if not self.isVisible():
+            return  # Dialog was cancelled while the request was running
+
+        user = result.get('user')
+        if user:
+            QMessageBox.information(self, "Success", 
+                                  "Authentication successful!")
+            self.mfa_verified.emit(user)
+            self.accept()
+        else:
+            QMessageBox.critical(self, "Verification Failed", 
+                               "Invalid verification code. Please try again.")
             self.code_input.clear()
             self.code_input.setFocus()
 
+    def on_verify_error(self, error):
+        """Handle a failed verify_mfa_code request (GUI thread)."""
+        self.set_verifying(False)
+        if not self.isVisible():
+            return
+
+        QMessageBox.critical(self, "Verification Failed",
+                           f"Code verification failed:\n{error}")
+        self.code_input.clear()
+        self.code_input.setFocus()
+
+    def set_verifying(self, verifying: bool):
+        """Lock the input and Verify button while a request is running."""
+        self.code_input.setEnabled(not verifying)
+        self.verify_btn.setEnabled(not verifying)
+        self.verify_btn.setText("Verifying..." if verifying else "Verify")
+
     def mousePressEvent(self, event):
         """Allow dragging the window."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -157,7 +179,7 @@ class MFAWindow(QDialog):
 
     def mouseMoveEvent(self, event):
         """Handle window dragging."""
-        if not hasattr(self, 'old_pos') or not self.old_pos:
+        if self.old_pos is None:
             return
         delta = event.globalPosition().toPoint() - self.old_pos
         self.move(self.pos() + delta)
@@ -2,129 +2,155 @@
 #
 # This module exports all utility functions and classes for easy importing.
 # Usage: from utils import AppConfig, format_currency, success, etc.
+#
+# Submodules are imported lazily (PEP 562): `from utils import success` only
+# loads utils.notifications, so importing one helper doesn't pull in every
+# PyQt-heavy utility module at startup.
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    # Configuration
+    'AppConfig': 'utils.config',
+
+    # Styles
+    'get_global_stylesheet': 'utils.styles',
+    'get_dashboard_card_style': 'utils.styles',
+    'get_product_card_style': 'utils.styles',
+    'get_category_card_style': 'utils.styles',
+    'get_dialog_style': 'utils.styles',
+    'get_header_bar_style': 'utils.styles',
+    'get_title_bar_style': 'utils.styles',
+    'get_loading_spinner_style': 'utils.styles',
+    'get_modern_card_style': 'utils.styles',
+    'get_badge_style': 'utils.styles',
+    'apply_table_styles': 'utils.styles',
+
+    # Helpers
+    'format_currency': 'utils.helpers',
+    'format_date': 'utils.helpers',
+    'format_datetime': 'utils.helpers',
+    'shorten_text': 'utils.helpers',
+    'humanize_quantity': 'utils.helpers',
+    'get_feather_icon': 'utils.helpers',
+    'load_product_image': 'utils.helpers',
+    'load_product_image_async': 'utils.helpers',
+    'save_product_image': 'utils.helpers',
+    'delete_product_image': 'utils.helpers',
+    'format_file_size': 'utils.helpers',
+    'calculate_percentage': 'utils.helpers',
+    'get_stock_status_label': 'utils.helpers',
+    'truncate_middle': 'utils.helpers',
+
+    # Icons
+    'get_icon': 'utils.icons',
+    'preload_common_icons': 'utils.icons',
+    'clear_icon_cache': 'utils.icons',
+    'get_icon_list': 'utils.icons',
+
+    # Cached assets
+    'load_logo_bytes': 'utils.asset_cache',
+    'get_logo_pixmap': 'utils.asset_cache',
+    'get_logo_icon': 'utils.asset_cache',
+
+    # Background workers
+    'run_api_call': 'utils.workers',
+    'ApiCallRunnable': 'utils.workers',
+
+    # Notifications
+    'show_notification': 'utils.notifications',
+    'success': 'utils.notifications',
+    'error': 'utils.notifications',
+    'warning': 'utils.notifications',
+    'info': 'utils.notifications',
+    'ToastNotification': 'utils.notifications',
+
+    # Validators
+    'validate_quantity': 'utils.validators',
+    'validate_price': 'utils.validators',
+    'validate_email': 'utils.validators',
+    'validate_password': 'utils.validators',
+    'validate_username': 'utils.validators',
+    'validate_product_name': 'utils.validators',
+    'validate_brand': 'utils.validators',
+    'validate_min_stock_level': 'utils.validators',
+    'validate_date_string': 'utils.validators',
+    'validate_not_empty': 'utils.validators',
+    'validate_length': 'utils.validators',
+    'validate_disposal_reason': 'utils.validators',
+    'validate_phone_number': 'utils.validators',
+
+    # Animations
+    'fade_in': 'utils.animations',
+    'fade_out': 'utils.animations',
+    'slide_in': 'utils.animations',
+    'slide_out': 'utils.animations',
+    'scale_up': 'utils.animations',
+    'pulse': 'utils.animations',
+    'setup_card_hover_effect': 'utils.animations',
+    'animate_page_transition': 'utils.animations',
+    'setup_button_press_effect': 'utils.animations',
+
+    # API Wrapper
+    'get_api': 'utils.api_wrapper',
+    'set_api': 'utils.api_wrapper',
+    'reset_api': 'utils.api_wrapper',
+    'login': 'utils.api_wrapper',
+    'logout': 'utils.api_wrapper',
+    'get_products': 'utils.api_wrapper',
+    'get_product': 'utils.api_wrapper',
+    'create_product': 'utils.api_wrapper',
+    'update_product': 'utils.api_wrapper',
+    'delete_product': 'utils.api_wrapper',
+    'get_stock_batches': 'utils.api_wrapper',
+    'add_stock_batch': 'utils.api_wrapper',
+    'dispose_product': 'utils.api_wrapper',
+    'record_sale': 'utils.api_wrapper',
+    'get_sales': 'utils.api_wrapper',
+    'get_categories': 'utils.api_wrapper',
+    'get_product_logs': 'utils.api_wrapper',
+    'get_current_user_data': 'utils.api_wrapper',
+    'verify_mfa': 'utils.api_wrapper',
+
+    # App State
+    'get_app_state': 'utils.app_state',
+    'get_current_user': 'utils.app_state',
+    'set_current_user': 'utils.app_state',
+    'get_api_client': 'utils.app_state',
+    'set_api_client': 'utils.app_state',
+    'is_dark_mode': 'utils.app_state',
+    'set_dark_mode': 'utils.app_state',
+    'get_selected_product_id': 'utils.app_state',
+    'set_selected_product_id': 'utils.app_state',
+    'get_selected_category_id': 'utils.app_state',
+    'set_selected_category_id': 'utils.app_state',
+    'clear_app_state': 'utils.app_state',
+}
+
+# Names exported under a different name than in their submodule
+_ALIASES = {
+    'get_feather_icon_from_icons': ('utils.icons', 'get_feather_icon'),
+}
+
+
+def __getattr__(name):
+    """Import the submodule behind an exported name on first access"""
+    if name in _ALIASES:
+        module_name, attr = _ALIASES[name]
+    elif name in _EXPORTS:
+        module_name, attr = _EXPORTS[name], name
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_ALIASES))
 
-# Configuration
-from utils.config import AppConfig
-
-# Styles
-from utils.styles import (
-    get_global_stylesheet,
-    get_dashboard_card_style,
-    get_product_card_style,
-    get_category_card_style,
-    get_dialog_style,
-    get_header_bar_style,
-    get_title_bar_style,
-    get_loading_spinner_style,
-    get_modern_card_style,
-    get_badge_style,
-    apply_table_styles
-)
-
-# Helpers
-from utils.helpers import (
-    format_currency,
-    format_date,
-    format_datetime,
-    shorten_text,
-    humanize_quantity,
-    get_feather_icon,
-    load_product_image,
-    save_product_image,
-    delete_product_image,
-    format_file_size,
-    calculate_percentage,
-    get_stock_status_label,
-    truncate_middle
-)
-
-# Icons
-from utils.icons import (
-    get_icon,
-    get_feather_icon as get_feather_icon_from_icons,
-    preload_common_icons,
-    clear_icon_cache,
-    get_icon_list
-)
-
-# Notifications
-from utils.notifications import (
-    show_notification,
-    success,
-    error,
-    warning,
-    info,
-    ToastNotification
-)
-
-# Validators
-from utils.validators import (
-    validate_quantity,
-    validate_price,
-    validate_email,
-    validate_password,
-    validate_username,
-    validate_product_name,
-    validate_brand,
-    validate_min_stock_level,
-    validate_date_string,
-    validate_not_empty,
-    validate_length,
-    validate_disposal_reason,
-    validate_phone_number
-)
-
-# Animations
-from utils.animations import (
-    fade_in,
-    fade_out,
-    slide_in,
-    slide_out,
-    scale_up,
-    pulse,
-    setup_card_hover_effect,
-    animate_page_transition,
-    setup_button_press_effect
-)
-
-# API Wrapper
-from utils.api_wrapper import (
-    get_api,
-    set_api,
-    reset_api,
-    login,
-    logout,
-    get_products,
-    get_product,
-    create_product,
-    update_product,
-    delete_product,
-    get_stock_batches,
-    add_stock_batch,
-    dispose_product,
-    record_sale,
-    get_sales,
-    get_categories,
-    get_product_logs,
-    get_current_user_data,
-    verify_mfa
-)
-
-# App State
-from utils.app_state import (
-    get_app_state,
-    get_current_user,
-    set_current_user,
-    get_api_client,
-    set_api_client,
-    is_dark_mode,
-    set_dark_mode,
-    get_selected_product_id,
-    set_selected_product_id,
-    get_selected_category_id,
-    set_selected_category_id,
-    clear_app_state
-)
 
 __all__ = [
     # Config
@@ -151,6 +177,7 @@ __all__ = [
     'humanize_quantity',
     'get_feather_icon',
     'load_product_image',
+    'load_product_image_async',
     'save_product_image',
     'delete_product_image',
     'format_file_size',
@@ -164,6 +191,15 @@ __all__ = [
     'clear_icon_cache',
     'get_icon_list',
     
+    # Cached assets
+    'load_logo_bytes',
+    'get_logo_pixmap',
+    'get_logo_icon',
+    
+    # Background workers
+    'run_api_call',
+    'ApiCallRunnable',
+    
     # Notifications
     'show_notification',
     'success',
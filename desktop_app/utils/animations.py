@@ -5,6 +5,7 @@
 #
 # Usage: Imported by UI modules to add smooth animations to widgets.
 
+from functools import partial
 from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QAbstractAnimation
 from PyQt6.QtWidgets import QWidget, QGraphicsOpacityEffect
 from PyQt6.QtGui import QTransform
@@ -208,11 +209,14 @@ def animate_page_transition(old_page: QWidget, new_page: QWidget, direction: str
         new_page: The page to fade in
         direction: Direction of transition
     """
-    def show_new():
-        new_page.show()
-        fade_in(new_page)
-    
-    fade_out(old_page, on_finished=lambda: (old_page.hide(), show_new()))
+    fade_out(old_page, on_finished=partial(_swap_pages, old_page, new_page))
+
+
+def _swap_pages(old_page: QWidget, new_page: QWidget):
+    """Hide the faded-out page and fade the new one in."""
+    old_page.hide()
+    new_page.show()
+    fade_in(new_page)
 
 
 def setup_button_press_effect(button: QWidget):
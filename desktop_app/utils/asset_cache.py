@@ -0,0 +1,72 @@
+# asset_cache.py
+#
+# This module keeps the StockaDoodle logo in memory once it has been loaded. The raw
+# PNG bytes are read from disk a single time per process, and each decoded (and
+# optionally scaled) QPixmap is stored in QPixmapCache so windows share it.
+#
+# Usage: Imported by main.py and the login/MFA windows for the app icon and logo.
+# Pixmap helpers need a running QApplication.
+
+import os
+from functools import lru_cache
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPixmapCache
+from utils.config import AppConfig
+
+
+LOGO_PATH = os.path.join(AppConfig.ICONS_DIR, "stockadoodle-transparent.png")
+
+
+@lru_cache(maxsize=1)
+def load_logo_bytes() -> bytes:
+    """
+    Read the logo PNG once and keep the raw bytes for later callers.
+
+    Returns:
+        bytes: The file contents, or b"" if the logo is missing
+    """
+    try:
+        with open(LOGO_PATH, "rb") as logo_file:
+            return logo_file.read()
+    except OSError:
+        return b""
+
+
+def get_logo_pixmap(size: int = None) -> QPixmap:
+    """
+    Get the logo as a QPixmap, decoding and scaling it only on first use.
+
+    Args:
+        size: Optional bounding box in pixels; the aspect ratio is kept
+
+    Returns:
+        QPixmap: The logo, or a null QPixmap if it could not be loaded
+    """
+    cache_key = "stockadoodle-logo" if size is None else f"stockadoodle-logo-{size}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None:
+        return pixmap
+
+    image = QImage.fromData(load_logo_bytes())
+    if image.isNull():
+        return QPixmap()
+
+    if size is not None:
+        image = image.scaled(
+            size, size, Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    pixmap = QPixmap.fromImage(image)
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+def get_logo_icon() -> QIcon:
+    """
+    Get the logo as a window/application icon.
+
+    Returns:
+        QIcon: The logo icon, or an empty QIcon if it could not be loaded
+    """
+    pixmap = get_logo_pixmap()
+    return QIcon(pixmap) if not pixmap.isNull() else QIcon()
@@ -84,6 +84,7 @@ class AppConfig:
     CARD_RADIUS = 12  # Border radius for cards
     BUTTON_RADIUS = 8  # Border radius for buttons
     INPUT_RADIUS = 6  # Border radius for inputs
+    PIXMAP_CACHE_LIMIT_KB = 65536  # QPixmapCache size for decoded images/thumbnails
     
     # --- Animation Configuration ---
     ANIMATION_DURATION = 200  # Duration in milliseconds for transitions
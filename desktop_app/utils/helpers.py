@@ -7,13 +7,21 @@
 
 import os
 import locale
+import logging
+import shutil
+import uuid
 from datetime import datetime
-from typing import Optional
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QFont, QColor
-from PyQt6.QtCore import Qt
+from functools import lru_cache, partial
+from typing import Callable, Optional
+from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache, QImage, QPainter, QFont, QColor
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QMessageBox
 from utils.config import AppConfig
 
+# Library-style logger; the application decides where (if anywhere) it goes
+log = logging.getLogger("stockadoodle.helpers")
+log.addHandler(logging.NullHandler())
+
 
 def format_currency(amount: float, symbol: Optional[str] = None) -> str:
     """
@@ -29,14 +37,33 @@ def format_currency(amount: float, symbol: Optional[str] = None) -> str:
     if symbol is None:
         symbol = AppConfig.CURRENCY_SYMBOL
     
+    # Key the cache on whole cents so equal prices share one entry
+    return _format_cents(round(amount * 100), symbol)
+
+
+@lru_cache(maxsize=1)
+def _currency_locale_available() -> bool:
+    """Switch to the currency locale once; False if it is not installed."""
     try:
-        # Try to use locale-specific formatting
         locale.setlocale(locale.LC_ALL, AppConfig.CURRENCY_LOCALE)
-        formatted = locale.currency(amount, grouping=True, symbol=False)
-        return f"{symbol}{formatted}"
-    except (locale.Error, ValueError):
-        # Fallback to manual formatting
-        return f"{symbol}{amount:,.2f}"
+        return True
+    except locale.Error:
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _format_cents(cents: int, symbol: str) -> str:
+    """Format an amount given in cents; memoized for format_currency."""
+    amount = cents / 100
+    if _currency_locale_available():
+        try:
+            # Try to use locale-specific formatting
+            formatted = locale.currency(amount, grouping=True, symbol=False)
+            return f"{symbol}{formatted}"
+        except ValueError:
+            pass
+    # Fallback to manual formatting
+    return f"{symbol}{amount:,.2f}"
 
 
 def format_date(date_value, format_str: Optional[str] = None) -> str:
@@ -55,14 +82,7 @@ def format_date(date_value, format_str: Optional[str] = None) -> str:
     
     # Handle different input types
     if isinstance(date_value, str):
-        # Try to parse common formats
-        for fmt in [AppConfig.DATE_FORMAT, AppConfig.DATETIME_FORMAT, "%Y-%m-%d %H:%M:%S"]:
-            try:
-                dt = datetime.strptime(date_value.split()[0], fmt.split()[0])
-                return dt.strftime(format_str)
-            except (ValueError, IndexError):
-                continue
-        return date_value  # Return as-is if parsing fails
+        return _format_date_string(date_value, format_str)
     
     elif hasattr(date_value, 'strftime'):
         # datetime object
@@ -74,6 +94,19 @@ def format_date(date_value, format_str: Optional[str] = None) -> str:
     return str(date_value)
 
 
+@lru_cache(maxsize=4096)
+def _format_date_string(date_value: str, format_str: str) -> str:
+    """Parse and reformat a date string; memoized since API dates repeat a lot."""
+    # Try to parse common formats
+    for fmt in [AppConfig.DATE_FORMAT, AppConfig.DATETIME_FORMAT, "%Y-%m-%d %H:%M:%S"]:
+        try:
+            dt = datetime.strptime(date_value.split()[0], fmt.split()[0])
+            return dt.strftime(format_str)
+        except (ValueError, IndexError):
+            continue
+    return date_value  # Return as-is if parsing fails
+
+
 def format_datetime(datetime_value, format_str: Optional[str] = None) -> str:
     """
     Format a datetime value as a string with time.
@@ -91,6 +124,7 @@ def format_datetime(datetime_value, format_str: Optional[str] = None) -> str:
     return format_date(datetime_value, format_str)
 
 
+@lru_cache(maxsize=1024)
 def shorten_text(text: str, max_length: int, suffix: str = "...") -> str:
     """
     Shorten text to a maximum length with ellipsis.
@@ -101,7 +135,7 @@ def shorten_text(text: str, max_length: int, suffix: str = "...") -> str:
         suffix: Suffix to add when truncated (default: "...")
         
     Returns:
-        Shortened text string
+        Shortened text string (cached, since lists repeat the same descriptions)
     """
     if not text or len(text) <= max_length:
         return text
@@ -129,6 +163,7 @@ def humanize_quantity(quantity: float) -> str:
         return f"{quantity / 1000000000:.1f}B"
 
 
+@lru_cache(maxsize=128)
 def get_feather_icon(icon_name: str, color: Optional[str] = None, size: int = 24):
     """
     Returns a QIcon by loading a PNG or SVG from the assets/icons/ directory.
@@ -140,10 +175,10 @@ def get_feather_icon(icon_name: str, color: Optional[str] = None, size: int = 24
         size: Desired size of the icon in pixels
         
     Returns:
-        QIcon: Icon object ready to use, or empty QIcon if not found
+        QIcon: Icon object ready to use, or empty QIcon if not found. One QIcon is
+        kept per (name, color, size) for the session; QIcon is implicitly shared,
+        so every button using it shares the same raster.
     """
-    from PyQt6.QtGui import QIcon
-    
     icon_path_png = os.path.join(AppConfig.ICONS_DIR, f"{icon_name}.png")
     icon_path_svg = os.path.join(AppConfig.ICONS_DIR, f"{icon_name}.svg")
     
@@ -168,8 +203,58 @@ def get_feather_icon(icon_name: str, color: Optional[str] = None, size: int = 24
         return QIcon()
 
 
+def _product_image_key(image_path: Optional[str], target_size: tuple,
+                       keep_aspect_ratio: bool, fast: bool = False) -> Optional[str]:
+    """
+    QPixmapCache key for a scaled product image, or None if there is no file.
+    
+    One stat() both checks the file exists and gives its mtime, so an image
+    replaced in place is decoded again. The path is made absolute so relative
+    and absolute references to the same file share one cache entry.
+    """
+    if not image_path:
+        return None
+    try:
+        mtime = os.stat(image_path).st_mtime
+    except OSError:
+        return None
+    return (f"product:{os.path.abspath(image_path)}:{mtime}:"
+            f"{target_size[0]}x{target_size[1]}:{int(keep_aspect_ratio)}:{int(fast)}")
+
+
+def _scale_thumbnail(image, target_size: tuple, keep_aspect_ratio: bool,
+                     fast: bool = False):
+    """
+    Scale a QImage (or QPixmap) down to target_size.
+    
+    Camera-sized photos get a cheap nearest-neighbour pass down to 2x the
+    thumbnail first, so the smooth filter only runs on a small image. With
+    fast=True only the nearest-neighbour pass is done (for tiny previews).
+    """
+    if keep_aspect_ratio:
+        aspect_mode = Qt.AspectRatioMode.KeepAspectRatio
+    else:
+        aspect_mode = Qt.AspectRatioMode.IgnoreAspectRatio
+    
+    if fast:
+        return image.scaled(
+            target_size[0], target_size[1],
+            aspect_mode, Qt.TransformationMode.FastTransformation
+        )
+    
+    if max(image.width(), image.height()) > 4 * max(target_size):
+        image = image.scaled(
+            target_size[0] * 2, target_size[1] * 2,
+            aspect_mode, Qt.TransformationMode.FastTransformation
+        )
+    return image.scaled(
+        target_size[0], target_size[1],
+        aspect_mode, Qt.TransformationMode.SmoothTransformation
+    )
+
+
 def load_product_image(image_path: Optional[str], target_size: tuple = (150, 150), 
-                       keep_aspect_ratio: bool = True) -> QPixmap:
+                       keep_aspect_ratio: bool = True, fast: bool = False) -> QPixmap:
     """
     Load a product image from path and scale it to target size.
     If the image cannot be loaded, returns a placeholder QPixmap.
@@ -178,31 +263,47 @@ def load_product_image(image_path: Optional[str], target_size: tuple = (150, 150
         image_path: Path to the image file (absolute or relative)
         target_size: Tuple of (width, height) for the scaled QPixmap
         keep_aspect_ratio: Whether to maintain aspect ratio while scaling
+        fast: Use nearest-neighbour scaling only (cheaper, fine for small previews)
         
     Returns:
-        QPixmap: The scaled QPixmap or placeholder
+        QPixmap: The scaled QPixmap or placeholder (served from QPixmapCache after
+        the first load)
     """
     placeholder_path = os.path.join(AppConfig.IMAGES_DIR, "no-image.png")
     
-    if image_path and os.path.exists(image_path):
+    cache_key = _product_image_key(image_path, target_size, keep_aspect_ratio, fast)
+    if cache_key is not None:
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap
+        
         try:
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                if keep_aspect_ratio:
-                    return pixmap.scaled(
-                        target_size[0], target_size[1],
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                else:
-                    return pixmap.scaled(
-                        target_size[0], target_size[1],
-                        Qt.AspectRatioMode.IgnoreAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
+            # Decode and scale as a QImage; only the final thumbnail becomes a QPixmap
+            image = QImage(image_path)
+            if not image.isNull():
+                pixmap = QPixmap.fromImage(
+                    _scale_thumbnail(image, target_size, keep_aspect_ratio, fast)
+                )
+                QPixmapCache.insert(cache_key, pixmap)
+                return pixmap
         except Exception as e:
             print(f"Error loading image {image_path}: {e}")
     
+    return _placeholder_pixmap(target_size)
+
+
+# (width, height) -> placeholder QPixmap; kept outside QPixmapCache so large photos
+# can never evict it. Filled lazily, since QPixmap needs a QApplication.
+_placeholder_pixmaps = {}
+
+
+def _placeholder_pixmap(target_size: tuple) -> QPixmap:
+    """Return the shared "No Image" placeholder, painting it once per size."""
+    target_size = tuple(target_size)
+    placeholder_pixmap = _placeholder_pixmaps.get(target_size)
+    if placeholder_pixmap is not None:
+        return placeholder_pixmap
+    
     # Generate placeholder
     placeholder_pixmap = QPixmap(target_size[0], target_size[1])
     placeholder_pixmap.fill(Qt.GlobalColor.transparent)
@@ -223,9 +324,96 @@ def load_product_image(image_path: Optional[str], target_size: tuple = (150, 150
     painter.drawText(placeholder_pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "No Image")
     
     painter.end()
+    _placeholder_pixmaps[target_size] = placeholder_pixmap
     return placeholder_pixmap
 
 
+class _ImageLoadSignals(QObject):
+    """Carries a decoded image from the worker thread back to the GUI thread."""
+    finished = pyqtSignal(QImage)
+
+
+class _ImageLoadTask(QRunnable):
+    """Decodes and scales one image file on a QThreadPool thread (QImage is safe
+    to use off the GUI thread, QPixmap is not)."""
+    
+    def __init__(self, image_path: str, target_size: tuple, keep_aspect_ratio: bool,
+                 fast: bool = False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.image_path = image_path
+        self.target_size = target_size
+        self.keep_aspect_ratio = keep_aspect_ratio
+        self.fast = fast
+        self.signals = _ImageLoadSignals()
+    
+    def run(self):
+        image = QImage(self.image_path)
+        if not image.isNull():
+            image = _scale_thumbnail(image, self.target_size, self.keep_aspect_ratio,
+                                     self.fast)
+        self.signals.finished.emit(image)
+
+
+# cache key -> (task, callbacks waiting for it); keeps each running task alive and
+# lets several widgets showing the same image share one decode
+_pending_image_loads = {}
+
+
+def load_product_image_async(image_path: Optional[str], callback: Callable[[QPixmap], None],
+                             target_size: tuple = (150, 150),
+                             keep_aspect_ratio: bool = True,
+                             fast: bool = False) -> QPixmap:
+    """
+    Load a product image without blocking the GUI thread.
+    
+    Cached images are returned directly. Otherwise the placeholder is returned
+    and the file is decoded on QThreadPool; callback receives the scaled QPixmap
+    on the GUI thread once it is ready.
+    
+    Args:
+        image_path: Path to the image file (absolute or relative)
+        callback: Called with the final QPixmap (e.g. image_label.setPixmap)
+        target_size: Tuple of (width, height) for the scaled QPixmap
+        keep_aspect_ratio: Whether to maintain aspect ratio while scaling
+        fast: Use nearest-neighbour scaling only (cheaper, fine for small previews)
+        
+    Returns:
+        QPixmap: The pixmap to show right away (cached image or placeholder)
+    """
+    cache_key = _product_image_key(image_path, target_size, keep_aspect_ratio, fast)
+    if cache_key is None:
+        return _placeholder_pixmap(target_size)
+    
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None:
+        return pixmap
+    
+    pending = _pending_image_loads.get(cache_key)
+    if pending is None:
+        task = _ImageLoadTask(image_path, target_size, keep_aspect_ratio, fast)
+        task.signals.finished.connect(partial(_on_image_loaded, cache_key))
+        pending = _pending_image_loads[cache_key] = (task, [])
+        QThreadPool.globalInstance().start(task)
+    pending[1].append(callback)
+    
+    return _placeholder_pixmap(target_size)
+
+
+def _on_image_loaded(cache_key: str, image: QImage):
+    """Runs on the GUI thread: convert to QPixmap once, cache it and notify callers."""
+    task, callbacks = _pending_image_loads.pop(cache_key)
+    if image.isNull():
+        log.warning("Error loading image %s", task.image_path)
+        pixmap = _placeholder_pixmap(task.target_size)
+    else:
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+    
+    for callback in callbacks:
+        callback(pixmap)
+
+
 def save_product_image(source_path: str) -> Optional[str]:
     """
     Save a product image from source path to the product images directory.
@@ -237,9 +425,6 @@ def save_product_image(source_path: str) -> Optional[str]:
     Returns:
         Relative path to the saved image file, or None if saving fails
     """
-    import shutil
-    import uuid
-    
     if not source_path:
         return None
     
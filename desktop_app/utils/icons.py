@@ -31,9 +31,10 @@ def get_icon(icon_name: str, color: str = None, size: int = 24) -> QIcon:
         QIcon: The loaded QIcon object, or empty QIcon if not found
     """
     # Create cache key
-    cache_key = f"{icon_name}_{color}_{size}"
-    if cache_key in _icon_cache:
-        return _icon_cache[cache_key]
+    cache_key = (icon_name, color, size)
+    icon = _icon_cache.get(cache_key)
+    if icon is not None:
+        return icon
     
     icon_path_png = os.path.join(AppConfig.ICONS_DIR, f"{icon_name}.png")
     icon_path_svg = os.path.join(AppConfig.ICONS_DIR, f"{icon_name}.svg")
@@ -54,9 +55,12 @@ def get_icon(icon_name: str, color: str = None, size: int = 24) -> QIcon:
             _icon_cache[cache_key] = icon
             return icon
     
-    # Icon not found
+    # Icon not found; cache the empty icon too so repeat lookups skip the
+    # filesystem checks and the warning is printed once
     print(f"Warning: Icon '{icon_name}' not found in {AppConfig.ICONS_DIR}")
-    return QIcon()
+    icon = QIcon()
+    _icon_cache[cache_key] = icon
+    return icon
 
 
 def _load_svg_icon(svg_path: str, color: str = None, size: int = 24) -> QIcon:
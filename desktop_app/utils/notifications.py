@@ -5,11 +5,23 @@
 #
 # Usage: Imported by UI modules to show success, error, warning, and info messages.
 
-from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QGraphicsOpacityEffect
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QLabel, QHBoxLayout, QVBoxLayout, QGraphicsOpacityEffect
+)
 from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QPoint
 from PyQt6.QtGui import QFont, QIcon, QPixmap
 from utils.config import AppConfig
 from utils.icons import get_icon
+from utils.styles import TOAST_COLORS
+
+
+# Icon mapping: notification type -> icon name
+_TOAST_ICONS = {
+    "success": "check-circle",
+    "error": "x-circle",
+    "warning": "alert-triangle",
+    "info": "info"
+}
 
 
 class ToastNotification(QWidget):
@@ -38,40 +50,15 @@ class ToastNotification(QWidget):
         
     def init_ui(self, message: str):
         """Initialize the UI components."""
-        # Color mapping
-        colors = {
-            "success": ("#00B894", "#2ED573"),
-            "error": ("#D63031", "#FF6B6B"),
-            "warning": ("#FDCB6E", "#FFA502"),
-            "info": (AppConfig.PRIMARY_COLOR, AppConfig.INFO_COLOR)
-        }
-        
-        bg_color, accent_color = colors.get(self.notification_type, colors["info"])
-        
-        # Icon mapping
-        icons = {
-            "success": "check-circle",
-            "error": "x-circle",
-            "warning": "alert-triangle",
-            "info": "info"
-        }
-        
-        icon_name = icons.get(self.notification_type, "info")
-        
-        # Main container
+        if self.notification_type not in TOAST_COLORS:
+            self.notification_type = "info"
+        bg_color, accent_color = TOAST_COLORS[self.notification_type]
+        icon_name = _TOAST_ICONS[self.notification_type]
+        
+        # Main container (styled by the toast rules in the global stylesheet)
         container = QWidget()
         container.setObjectName("toastContainer")
-        container.setStyleSheet(f"""
-            #toastContainer {{
-                background-color: {AppConfig.CARD_BACKGROUND};
-                border: 2px solid {accent_color};
-                border-left: 4px solid {accent_color};
-                border-radius: {AppConfig.BUTTON_RADIUS}px;
-                padding: 15px 20px;
-                min-width: 300px;
-                max-width: 400px;
-            }}
-        """)
+        container.setProperty("toastType", self.notification_type)
         
         layout = QHBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -85,24 +72,14 @@ class ToastNotification(QWidget):
         
         # Message
         message_label = QLabel(message)
+        message_label.setObjectName("toastMessage")
         message_label.setWordWrap(True)
-        message_label.setStyleSheet(f"""
-            color: {AppConfig.TEXT_COLOR};
-            font-size: {AppConfig.FONT_SIZE_MEDIUM}pt;
-            background-color: transparent;
-        """)
         layout.addWidget(message_label, 1)
         
         # Close button
         close_btn = QLabel("×")
-        close_btn.setStyleSheet(f"""
-            color: {AppConfig.TEXT_COLOR_ALT};
-            font-size: 20pt;
-            font-weight: bold;
-            background-color: transparent;
-            padding: 0px;
-        """)
-        close_btn.mousePressEvent = lambda e: self.close()
+        close_btn.setObjectName("toastClose")
+        close_btn.mousePressEvent = self._on_close_pressed
         layout.addWidget(close_btn)
         
         # Main layout
@@ -110,6 +87,10 @@ class ToastNotification(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(container)
     
+    def _on_close_pressed(self, event):
+        """Close the toast when the "×" label is clicked."""
+        self.close()
+    
     def setup_animation(self):
         """Setup fade-in and slide animations."""
         # Opacity effect
@@ -157,7 +138,6 @@ _notification_widgets = []  # Track active notifications
 
 def _get_parent_window():
     """Get the main application window as parent."""
-    from PyQt6.QtWidgets import QApplication
     app = QApplication.instance()
     if app:
         for widget in app.topLevelWidgets():
@@ -5,16 +5,60 @@
 #
 # Usage: Imported by UI modules to apply consistent styling across the application.
 
+from functools import lru_cache
 from utils.config import AppConfig
 from PyQt6.QtWidgets import QTableWidget, QHeaderView
 from PyQt6.QtGui import QFont, QColor
 from PyQt6.QtCore import Qt
 
 
+# Toast notification type -> (background, accent) colors
+TOAST_COLORS = {
+    "success": ("#00B894", "#2ED573"),
+    "error": ("#D63031", "#FF6B6B"),
+    "warning": ("#FDCB6E", "#FFA502"),
+    "info": (AppConfig.PRIMARY_COLOR, AppConfig.INFO_COLOR)
+}
+
+# Toasts pick their accent through the toastType property, so every toast
+# shares these rules instead of formatting its own stylesheets
+_TOAST_QSS = f"""
+    QWidget#toastContainer {{
+        background-color: {AppConfig.CARD_BACKGROUND};
+        border: 2px solid {AppConfig.INFO_COLOR};
+        border-left: 4px solid {AppConfig.INFO_COLOR};
+        border-radius: {AppConfig.BUTTON_RADIUS}px;
+        padding: 15px 20px;
+        min-width: 300px;
+        max-width: 400px;
+    }}
+    
+    QLabel#toastMessage {{
+        color: {AppConfig.TEXT_COLOR};
+        font-size: {AppConfig.FONT_SIZE_MEDIUM}pt;
+        background-color: transparent;
+    }}
+    
+    QLabel#toastClose {{
+        color: {AppConfig.TEXT_COLOR_ALT};
+        font-size: 20pt;
+        font-weight: bold;
+        background-color: transparent;
+        padding: 0px;
+    }}
+    """ + "".join(f"""
+    QWidget#toastContainer[toastType="{toast_type}"] {{
+        border-color: {accent_color};
+    }}
+    """ for toast_type, (_, accent_color) in TOAST_COLORS.items())
+
+
+@lru_cache(maxsize=1)
 def get_global_stylesheet():
     """
     Returns the global stylesheet for the entire application.
-    This includes base styling for all common widgets.
+    This includes base styling for all common widgets, the card classes and toast
+    notifications, so it is applied once on the QApplication instead of per widget.
     """
     return f"""
     /* Main Window */
@@ -295,15 +339,16 @@ def get_global_stylesheet():
         background-color: {AppConfig.PRIMARY_COLOR};
         border-radius: {AppConfig.INPUT_RADIUS - 1}px;
     }}
-    """
+    """ + _PRODUCT_CARD_QSS + _CATEGORY_CARD_QSS + _MODERN_CARD_QSS + _TOAST_QSS
 
 
+@lru_cache(maxsize=32)
 def get_dashboard_card_style(color):
     """
     Returns stylesheet for a general dashboard summary card.
     
     Args:
-        color: Hex color code for the card accent
+        color: Hex color code for the card accent (one cached stylesheet per color)
     """
     lighter_color = QColor(color).lighter(110).name()
     return f"""
@@ -341,9 +386,8 @@ def get_dashboard_card_style(color):
     """
 
 
-def get_product_card_style():
-    """Returns stylesheet for product cards in ProductListWidget."""
-    return f"""
+# Card stylesheets only depend on AppConfig constants, so they are formatted once at import
+_PRODUCT_CARD_QSS = f"""
     QFrame.product-card {{
         background-color: {AppConfig.CARD_BACKGROUND};
         border: 1px solid {AppConfig.BORDER_COLOR};
@@ -407,9 +451,12 @@ def get_product_card_style():
     """
 
 
-def get_category_card_style():
-    """Returns stylesheet for category cards."""
-    return f"""
+def get_product_card_style():
+    """Returns stylesheet for product cards in ProductListWidget."""
+    return _PRODUCT_CARD_QSS
+
+
+_CATEGORY_CARD_QSS = f"""
     QFrame.category-card {{
         background-color: {AppConfig.CARD_BACKGROUND};
         border: 1px solid {AppConfig.BORDER_COLOR};
@@ -431,6 +478,12 @@ def get_category_card_style():
     """
 
 
+def get_category_card_style():
+    """Returns stylesheet for category cards."""
+    return _CATEGORY_CARD_QSS
+
+
+@lru_cache(maxsize=1)
 def get_dialog_style():
     """Returns stylesheet for general dialog windows."""
     return f"""
@@ -482,6 +535,7 @@ def get_dialog_style():
     """
 
 
+@lru_cache(maxsize=1)
 def get_header_bar_style():
     """Returns stylesheet for the header bar."""
     return f"""
@@ -529,6 +583,7 @@ def get_header_bar_style():
     """
 
 
+@lru_cache(maxsize=1)
 def get_title_bar_style():
     """Returns stylesheet for custom title bar (frameless window)."""
     return f"""
@@ -562,6 +617,7 @@ def get_title_bar_style():
     """
 
 
+@lru_cache(maxsize=1)
 def get_loading_spinner_style():
     """Returns stylesheet for loading spinner component."""
     return f"""
@@ -576,9 +632,7 @@ def get_loading_spinner_style():
     """
 
 
-def get_modern_card_style():
-    """Returns stylesheet for modern card component."""
-    return f"""
+_MODERN_CARD_QSS = f"""
     QFrame.modern-card {{
         background-color: {AppConfig.CARD_BACKGROUND};
         border: 1px solid {AppConfig.BORDER_COLOR};
@@ -594,6 +648,12 @@ def get_modern_card_style():
     """
 
 
+def get_modern_card_style():
+    """Returns stylesheet for modern card component."""
+    return _MODERN_CARD_QSS
+
+
+@lru_cache(maxsize=32)
 def get_badge_style(color=None):
     """Returns stylesheet for badge/pill components."""
     if not color:
@@ -610,14 +670,8 @@ def get_badge_style(color=None):
     """
 
 
-def apply_table_styles(table_widget: QTableWidget):
-    """
-    Applies consistent styling and sizing to a QTableWidget.
-    
-    Args:
-        table_widget: The QTableWidget to style
-    """
-    table_widget.setStyleSheet(f"""
+# Shared by every table; formatted once at import
+_TABLE_QSS = f"""
         QTableWidget {{
             background-color: {AppConfig.CARD_BACKGROUND};
             color: {AppConfig.TEXT_COLOR};
@@ -654,7 +708,17 @@ def apply_table_styles(table_widget: QTableWidget):
         QTableWidget QHeaderView::section:last-child {{
             border-right: none;
         }}
-    """)
+    """
+
+
+def apply_table_styles(table_widget: QTableWidget):
+    """
+    Applies consistent styling and sizing to a QTableWidget.
+    
+    Args:
+        table_widget: The QTableWidget to style
+    """
+    table_widget.setStyleSheet(_TABLE_QSS)
     
     # Set default row height
     table_widget.verticalHeader().setDefaultSectionSize(AppConfig.TABLE_ROW_HEIGHT)
@@ -0,0 +1,74 @@
+# workers.py
+#
+# This module runs blocking work (mostly StockaDoodleAPI requests) on Qt's global
+# QThreadPool so windows stay responsive while waiting on the network. Results and
+# errors are delivered back on the GUI thread through Qt signals.
+#
+# Usage: Imported by UI modules, e.g.
+#     run_api_call(self.api_client.login, username, password,
+#                  on_result=self.on_login_result, on_error=self.on_login_error)
+
+from typing import Callable, Optional
+from functools import partial
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class ApiCallSignals(QObject):
+    """Signals emitted by ApiCallRunnable (queued to the GUI thread)."""
+    result = pyqtSignal(object)  # Return value of the call
+    error = pyqtSignal(object)  # Exception raised by the call
+    finished = pyqtSignal()  # Emitted last, after result or error
+
+
+class ApiCallRunnable(QRunnable):
+    """Runs func(*args, **kwargs) on a pool thread and reports through signals."""
+
+    def __init__(self, func: Callable, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = ApiCallSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+# id -> runnable; keeps each call (and its signals object) alive until it finishes
+_active_calls = {}
+
+
+def run_api_call(func: Callable, *args, on_result: Optional[Callable] = None,
+                 on_error: Optional[Callable] = None, **kwargs) -> ApiCallRunnable:
+    """
+    Run a blocking call on the global QThreadPool.
+
+    Args:
+        func: The callable to run (e.g. a StockaDoodleAPI method)
+        *args: Positional arguments for func
+        on_result: Called on the GUI thread with func's return value
+        on_error: Called on the GUI thread with the raised exception
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        ApiCallRunnable: The submitted task (its signals can be connected further)
+    """
+    task = ApiCallRunnable(func, *args, **kwargs)
+    if on_result is not None:
+        task.signals.result.connect(on_result)
+    if on_error is not None:
+        task.signals.error.connect(on_error)
+
+    _active_calls[id(task)] = task
+    task.signals.finished.connect(partial(_active_calls.pop, id(task), None))
+
+    QThreadPool.globalInstance().start(task)
+    return task